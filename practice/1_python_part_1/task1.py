@@ -10,9 +10,17 @@ Examples:
     [1, 2, 3]
     >>> delete_from_list([], 'b')
     []
+    >>> delete_many_from_list([1, 2, 3, 4, 3], [3, 4])
+    [1, 2]
+    >>> delete_many_from_list(['a', 'b', 'c', 'b', 'd'], predicate=lambda item: item < 'c')
+    ['c', 'd']
+    >>> delete_many_from_list([[1], 2, 3], [2])
+    [[1], 3]
 """
 
-from typing import Any, List
+import random
+import time
+from typing import Any, Callable, Iterable, List, Optional
 
 
 def delete_from_list(list_to_clean: List, item_to_delete: Any) -> List:
@@ -21,7 +29,75 @@ def delete_from_list(list_to_clean: List, item_to_delete: Any) -> List:
     return list_to_clean
 
 
+def delete_many_from_list(
+    list_to_clean: List, items_to_delete: Iterable[Any] = (), predicate: Optional[Callable[[Any], bool]] = None
+) -> List:
+    """Removes all given items (and items matching predicate) in a single in-place pass.
+
+    Kept items are compacted to the front of the list, then the leftover tail is
+    popped from the end, so every .pop call is O(1) and the whole pass is linear.
+    Hashable items are looked up in a set; unhashable items to delete, and unhashable
+    items of the list, are compared linearly like in delete_from_list.
+    """
+    items_to_delete = list(items_to_delete)
+    hashable_items = set()
+    unhashable_items = []
+    for item in items_to_delete:
+        try:
+            hashable_items.add(item)
+        except TypeError:
+            unhashable_items.append(item)
+
+    def is_deleted(item: Any) -> bool:
+        try:
+            if item in hashable_items:
+                return True
+        except TypeError:
+            return item in items_to_delete
+        return bool(unhashable_items) and item in unhashable_items
+
+    write_idx = 0
+    for item in list_to_clean:
+        if is_deleted(item) or (predicate is not None and predicate(item)):
+            continue
+        list_to_clean[write_idx] = item
+        write_idx += 1
+
+    for _ in range(len(list_to_clean) - write_idx):
+        list_to_clean.pop()
+    return list_to_clean
+
+
+def benchmark(
+    size: int = 10**6, legacy_size: int = 10**4, hit_rates: Iterable[float] = (0.01, 0.5, 0.99)
+) -> None:
+    """Compares delete_from_list with delete_many_from_list for several hit rates.
+
+    delete_from_list is quadratic, so it is timed on the first legacy_size elements only.
+    """
+    for hit_rate in hit_rates:
+        data = [0 if random.random() < hit_rate else random.randint(1, 100) for _ in range(size)]
+
+        start_time = time.perf_counter()
+        delete_from_list(data[:legacy_size], 0)
+        loop_duration = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        delete_many_from_list(data.copy(), [0])
+        single_pass_duration = time.perf_counter() - start_time
+
+        print(
+            f"hit_rate={hit_rate:.0%}: delete_from_list({min(size, legacy_size)}) {loop_duration:.3f}s, "
+            f"delete_many_from_list({size}) {single_pass_duration:.3f}s"
+        )
+
+
 print(delete_from_list([1, 2, 3, 4, 3], 3))
 print(delete_from_list(["a", "b", "c", "b", "d"], "b"))
 print(delete_from_list([1, 2, 3], "b"))
 print(delete_from_list([], "b"))
+print(delete_many_from_list([1, 2, 3, 4, 3], [3, 4]))
+print(delete_many_from_list(["a", "b", "c", "b", "d"], predicate=lambda item: item < "c"))
+
+if __name__ == "__main__":
+    benchmark()
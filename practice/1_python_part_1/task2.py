@@ -8,9 +8,17 @@ Examples:
     {a: 0}
     >>> set_to_dict({'a': 5})
     {'a': 5}
+    >>> max_merge([{'a': 0, 'b': 4}, ('c', 7), {'c': 5}], {'a': 1, 'b': 2, 'c': 3})
+    {'a': 1, 'b': 4, 'c': 7}
 """
 
-from typing import Dict
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+MergeSource = Union[Mapping[str, int], Tuple[str, int]]
 
 
 def set_to_dict(dict_to_update: Dict[str, int], **items_to_set) -> Dict:
@@ -20,6 +28,78 @@ def set_to_dict(dict_to_update: Dict[str, int], **items_to_set) -> Dict:
     return dict_to_update
 
 
+def _merge_into(merged: Dict[str, int], sources: Iterable[MergeSource]) -> Dict[str, int]:
+    """Merges mappings or (key, value) pairs into merged, keeping the max value of every key."""
+    missing = object()
+    get_value = merged.get
+    for source in sources:
+        if isinstance(source, tuple):
+            source = (source,)
+        else:
+            source = source.items()
+        for key, value in source:
+            current_value = get_value(key, missing)
+            if current_value is missing or current_value < value:
+                merged[key] = value
+    return merged
+
+
+def _merge_shard(sources: List[MergeSource]) -> Dict[str, int]:
+    return _merge_into({}, sources)
+
+
+def max_merge(
+    sources: Iterable[MergeSource],
+    dict_to_update: Optional[Dict[str, int]] = None,
+    workers: int = 1,
+    shard_size: int = 100_000,
+) -> Dict[str, int]:
+    """Bulk version of set_to_dict for an iterable of mappings and/or (key, value) pairs.
+
+    With workers > 1 the sources are cut into shards of shard_size items, merged in a process
+    pool, and the partial maps are reduced into dict_to_update.
+    """
+    if dict_to_update is None:
+        dict_to_update = {}
+    if workers <= 1:
+        return _merge_into(dict_to_update, sources)
+
+    sources_iter = iter(sources)
+    shards = iter(lambda: list(islice(sources_iter, shard_size)), [])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for partial in executor.map(_merge_shard, shards):
+            _merge_into(dict_to_update, (partial,))
+    return dict_to_update
+
+
+def benchmark(batches_count: int = 10**6, keys_count: int = 1000, batch_size: int = 3) -> None:
+    """Compares repeated set_to_dict calls with a single max_merge call."""
+    keys = [f"key_{i}" for i in range(keys_count)]
+    batches = [
+        {key: random.randint(0, 10**6) for key in random.sample(keys, batch_size)} for _ in range(batches_count)
+    ]
+
+    start_time = time.perf_counter()
+    repeated_result = {}
+    for batch in batches:
+        set_to_dict(repeated_result, **batch)
+    print(f"set_to_dict x {batches_count}: {time.perf_counter() - start_time:.3f}s")
+
+    start_time = time.perf_counter()
+    merged_result = max_merge(batches)
+    print(f"max_merge: {time.perf_counter() - start_time:.3f}s")
+
+    start_time = time.perf_counter()
+    sharded_result = max_merge(batches, workers=4)
+    print(f"max_merge (4 workers): {time.perf_counter() - start_time:.3f}s")
+
+    assert repeated_result == merged_result == sharded_result
+
+
 print(set_to_dict({"a": 1, "b": 2, "c": 3}, a=0, b=4))
 print(set_to_dict({}, a=0))
 print(set_to_dict({"a": 5}))
+print(max_merge([{"a": 0, "b": 4}, ("c", 7), {"c": 5}], {"a": 1, "b": 2, "c": 3}))
+
+if __name__ == "__main__":
+    benchmark()
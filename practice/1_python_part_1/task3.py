@@ -13,15 +13,19 @@ Examples:
     ''
 """
 
+from itertools import islice
 from typing import Iterable
 
+from utils import iter_unique_words
+
 
 def build_from_unique_words(*lines: Iterable[str], word_number: int) -> str:
     words_list = []
     for line in lines:
-        ordered_set = list(dict.fromkeys(line.split()))
-        if word_number < len(ordered_set):
-            words_list.append(ordered_set[word_number])
+        # Stop scanning the line as soon as the word_number-th unique word is found
+        word = next(islice(iter_unique_words(line), word_number, None), None)
+        if word is not None:
+            words_list.append(word)
     return " ".join(words_list)
 
 
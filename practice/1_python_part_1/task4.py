@@ -7,7 +7,20 @@ Examples:
     [1, 4, 7]  # because [1^2, 2^2 - (1^2 - 1), 3^2 - (2^2 - 2)]
 """
 
-from typing import List
+from collections import deque
+from itertools import chain, islice, tee
+from typing import Iterable, Iterator, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+CHUNK_SIZE = 1024 * 1024
+# Values are read in small blocks, so the tee replaying a failed np.fromiter only buffers one block
+READ_BLOCK_SIZE = 4096
+# For |x| < 2**31 every term of x[i]^2 - (x[i-1]^2 - x[i-1]) fits into int64
+INT64_SAFE_LIMIT = 2**31
 
 
 def calculate_power_with_difference(ints: List[int]) -> List[int]:
@@ -20,4 +33,71 @@ def calculate_power_with_difference(ints: List[int]) -> List[int]:
     return results_list
 
 
+def iter_power_with_difference(ints: Iterable[int], chunk_size: int = CHUNK_SIZE) -> Iterator[Sequence[int]]:
+    """Streams calculate_power_with_difference results chunk by chunk.
+
+    When numpy is available, values are read straight into int64 arrays with np.fromiter, so no
+    Python int is kept per element, and chunks are computed with shifted vector operations and
+    yielded as int64 arrays. A chunk holding a value too big for int64 math is computed with exact
+    Python ints and yielded as a list. The difference carried over from the previous chunk is kept
+    as a Python int, because after big values it may not fit into int64.
+    """
+    if np is None:
+        ints_iter = iter(ints)
+        prev_substract = 0
+        while True:
+            chunk = list(islice(ints_iter, chunk_size))
+            if not chunk:
+                return
+            results = calculate_power_with_difference(chunk)
+            results[0] -= prev_substract
+            prev_substract = chunk[-1] ** 2 - chunk[-1]
+            yield results
+
+    source, replay = tee(ints)
+    prev_substract = 0
+    while True:
+        blocks = []
+        remaining = chunk_size
+        while remaining:
+            count = min(READ_BLOCK_SIZE, remaining)
+            try:
+                block = np.fromiter(islice(source, count), dtype=np.int64)
+                deque(islice(replay, len(block)), maxlen=0)
+            except OverflowError:
+                # replay lags one block behind source, so it still has the values np.fromiter consumed
+                block = list(islice(replay, count))
+                source, replay = tee(replay)
+            if len(block):
+                blocks.append(block)
+                remaining -= len(block)
+            if len(block) < count:
+                break
+        if not blocks:
+            return
+
+        exact = any(isinstance(block, list) for block in blocks)
+        if not exact:
+            values = np.concatenate(blocks)
+            exact = not (-INT64_SAFE_LIMIT < values.min() and values.max() < INT64_SAFE_LIMIT)
+
+        if exact:
+            chunk = list(chain.from_iterable(block if isinstance(block, list) else block.tolist() for block in blocks))
+            results = calculate_power_with_difference(chunk)
+            results[0] -= prev_substract
+            prev_substract = chunk[-1] ** 2 - chunk[-1]
+        else:
+            powers = values * values
+            results = powers.copy()
+            results[1:] -= powers[:-1] - values[:-1]
+            if prev_substract < INT64_SAFE_LIMIT**2:
+                results[0] -= prev_substract
+            else:
+                results = results.tolist()
+                results[0] -= prev_substract
+            last_value = int(values[-1])
+            prev_substract = last_value**2 - last_value
+        yield results
+
 print(calculate_power_with_difference([1, 2, 3]))
+print([int(value) for chunk in iter_power_with_difference(iter([1, 2, 3]), chunk_size=2) for value in chunk])
@@ -9,13 +9,59 @@ Examples:
     'cat'
     >>> remove_duplicated_words('1 2 3')
     '1 2 3'
+    >>> remove_duplicated_words('cat cat dog 1 dog 2', bloom_size=1024)
+    'cat dog 1 2'
+    >>> remove_duplicated_words('a b c d e f g h a', bloom_size=8)
+    'a b c d e f g h'
 """
 
+import random
+import string
+import time
+from itertools import islice
+from typing import Optional
+
+from utils import iter_unique_words
+
 
-def remove_duplicated_words(line: str) -> str:
+def remove_duplicated_words(line: str, bloom_size: Optional[int] = None) -> str:
+    """Removes duplicated words, pre-checking them with a Bloom filter of bloom_size bits if it is given."""
+    if bloom_size is not None:
+        return " ".join(iter_unique_words(line, bloom_size))
     return " ".join(list(dict.fromkeys(line.split())))
 
 
+def benchmark(size_in_bytes: int = 100 * 1024 * 1024, vocabulary_size: int = 100_000) -> None:
+    """Compares split-based and streaming deduplication on one long line."""
+    vocabulary = [
+        "".join(random.choices(string.ascii_lowercase, k=random.randint(3, 10))) for _ in range(vocabulary_size)
+    ]
+    words_count = size_in_bytes // 8
+    line = " ".join(random.choices(vocabulary, k=words_count))
+    print(f"line size: {len(line) / 1024 / 1024:.0f} MB")
+
+    start_time = time.perf_counter()
+    list(dict.fromkeys(line.split()))[10]
+    print(f"10th unique word, split: {time.perf_counter() - start_time:.3f}s")
+
+    start_time = time.perf_counter()
+    next(islice(iter_unique_words(line), 10, None))
+    print(f"10th unique word, streaming: {time.perf_counter() - start_time:.6f}s")
+
+    start_time = time.perf_counter()
+    remove_duplicated_words(line)
+    print(f"remove_duplicated_words, split: {time.perf_counter() - start_time:.3f}s")
+
+    start_time = time.perf_counter()
+    remove_duplicated_words(line, bloom_size=vocabulary_size * 16)
+    print(f"remove_duplicated_words, bloom filter: {time.perf_counter() - start_time:.3f}s")
+
+
 print(remove_duplicated_words("cat cat dog 1 dog 2"))
 print(remove_duplicated_words("cat cat cat"))
 print(remove_duplicated_words("1 2 3"))
+print(remove_duplicated_words("cat cat dog 1 dog 2", bloom_size=1024))
+print(remove_duplicated_words("a b c d e f g h a", bloom_size=8))
+
+if __name__ == "__main__":
+    benchmark()
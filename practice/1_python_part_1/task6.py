@@ -17,15 +17,94 @@ with open(filename) as opened_file:
         ...
 """
 
-from typing import Tuple
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple, Union
+
+CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def _reduce_range(filename: str, start: int, end: int, chunk_size: int = CHUNK_SIZE) -> Tuple[int, int, int, int, int]:
+    """Reduces integers between two line-aligned byte offsets to (count, sum, sum of squares, min, max)."""
+    count, total, total_sq = 0, 0, 0
+    min_value, max_value = None, None
+    with open(filename, "rb") as opened_file:
+        opened_file.seek(start)
+        position = start
+        while position < end:
+            # Complete the last line of the chunk so no integer is split in two
+            chunk = opened_file.read(min(chunk_size, end - position))
+            if position + len(chunk) < end:
+                chunk += opened_file.readline()
+            position += len(chunk)
+
+            integers = list(map(int, chunk.split()))
+            if not integers:
+                continue
+            count += len(integers)
+            total += sum(integers)
+            total_sq += sum(value * value for value in integers)
+            chunk_min, chunk_max = min(integers), max(integers)
+            min_value = chunk_min if min_value is None else min(min_value, chunk_min)
+            max_value = chunk_max if max_value is None else max(max_value, chunk_max)
+    return count, total, total_sq, min_value, max_value
+
+
+def _split_on_lines(filename: str, parts: int) -> List[int]:
+    """Returns byte offsets which split the file into roughly equal parts on line boundaries."""
+    file_size = os.path.getsize(filename)
+    boundaries = [0]
+    with open(filename, "rb") as opened_file:
+        for part in range(1, parts):
+            opened_file.seek(max(file_size * part // parts, boundaries[-1]))
+            opened_file.readline()
+            boundaries.append(min(opened_file.tell(), file_size))
+    boundaries.append(file_size)
+    return boundaries
+
+
+def get_stats(filename: str, workers: int = 1, chunk_size: int = CHUNK_SIZE) -> Dict[str, Union[int, float]]:
+    """Returns count, sum, min, max, mean and variance of the integers in file in a single streaming pass.
+
+    With workers > 1 the file is split on line boundaries and reduced in separate processes.
+    """
+    if workers > 1:
+        boundaries = _split_on_lines(filename, workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partials = list(
+                executor.map(
+                    _reduce_range,
+                    [filename] * workers,
+                    boundaries[:-1],
+                    boundaries[1:],
+                    [chunk_size] * workers,
+                )
+            )
+    else:
+        partials = [_reduce_range(filename, 0, os.path.getsize(filename), chunk_size)]
+
+    partials = [partial for partial in partials if partial[0]]
+    if not partials:
+        raise ValueError(f"No integers found in {filename}")
+
+    count = sum(partial[0] for partial in partials)
+    total = sum(partial[1] for partial in partials)
+    total_sq = sum(partial[2] for partial in partials)
+    return {
+        "count": count,
+        "sum": total,
+        "min": min(partial[3] for partial in partials),
+        "max": max(partial[4] for partial in partials),
+        "mean": total / count,
+        "variance": (count * total_sq - total * total) / (count * count),
+    }
 
 
 def get_min_max(filename: str) -> Tuple[int, int]:
-    with open(filename) as opened_file:
-        integers = []
-        for line in opened_file:
-            integers.append(int(line))
-        return min(integers), max(integers)
+    stats = get_stats(filename)
+    return stats["min"], stats["max"]
 
 
-print(get_min_max("practice/1_python_part_1/task6_file.txt"))
+if __name__ == "__main__":
+    print(get_min_max("practice/1_python_part_1/task6_file.txt"))
+    print(get_stats("practice/1_python_part_1/task6_file.txt", workers=2))
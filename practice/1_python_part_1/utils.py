@@ -0,0 +1,67 @@
+import hashlib
+import re
+from typing import Iterator, Optional
+
+WORD_PATTERN = re.compile(r"\S+")
+
+
+class BloomFilter:
+    """Fixed-size probabilistic set: no false negatives, rare false positives."""
+
+    def __init__(self, size_in_bits: int, hashes_count: int = 4) -> None:
+        self.size_in_bits = size_in_bits
+        self.hashes_count = hashes_count
+        self.bits = bytearray((size_in_bits + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        # Built-in hash() is salted per process, so use a stable digest split into two hashes
+        digest = hashlib.blake2b(item.encode(), digest_size=8).digest()
+        first_hash = int.from_bytes(digest[:4], "little")
+        second_hash = int.from_bytes(digest[4:], "little") | 1
+        for i in range(self.hashes_count):
+            yield (first_hash + i * second_hash) % self.size_in_bits
+
+    def add(self, item: str) -> bool:
+        """Adds item and returns True if it was (probably) already present."""
+        present = True
+        for position in self._positions(item):
+            byte_idx, bit = divmod(position, 8)
+            if not self.bits[byte_idx] & (1 << bit):
+                present = False
+                self.bits[byte_idx] |= 1 << bit
+        return present
+
+
+def iter_words(line: str) -> Iterator[str]:
+    """Lazily yields space separated words without building the full split list."""
+    for match in WORD_PATTERN.finditer(line):
+        yield match.group()
+
+
+def iter_unique_words(line: str, bloom_size: Optional[int] = None) -> Iterator[str]:
+    """Lazily yields words of line in order of first occurrence.
+
+    With bloom_size (in bits) the line is scanned twice: the first pass feeds a Bloom filter of that
+    size and collects only the words it reports as already seen (real duplicates plus rare false
+    positives); the second pass yields every other word directly and checks just those candidates
+    against an exact set. Memory depends on the number of repeated words, not unique ones, and no
+    word is ever dropped.
+    """
+    if bloom_size is not None:
+        bloom_filter = BloomFilter(bloom_size)
+        candidates = {word for word in iter_words(line) if bloom_filter.add(word)}
+        del bloom_filter
+        seen_candidates = set()
+        for word in iter_words(line):
+            if word not in candidates:
+                yield word
+            elif word not in seen_candidates:
+                seen_candidates.add(word)
+                yield word
+        return
+
+    seen_words = set()
+    for word in iter_words(line):
+        if word not in seen_words:
+            seen_words.add(word)
+            yield word
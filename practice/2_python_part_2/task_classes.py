@@ -27,7 +27,9 @@ PEP8 comply strictly.
 """
 
 import datetime
-from typing import Optional
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Optional, Tuple
 
 
 class Homework:
@@ -39,6 +41,8 @@ class Homework:
         created (datetime.datetime): The timestamp when the task was created.
     """
 
+    __slots__ = ("text", "deadline", "created")
+
     def __init__(self, text: str, days_to_complete: int) -> None:
         """Initializes a Homework instance.
 
@@ -50,13 +54,100 @@ class Homework:
         self.deadline = datetime.timedelta(days_to_complete)
         self.created = datetime.datetime.now()
 
-    def is_active(self) -> bool:
+    @property
+    def expires_at(self) -> datetime.datetime:
+        """The moment when the homework deadline is reached."""
+        return self.created + self.deadline
+
+    def is_active(self, now: Optional[datetime.datetime] = None) -> bool:
         """Checks if the homework deadline has passed.
 
+        Args:
+            now: The moment to check against, so a batch of checks can share
+                one timestamp. Defaults to the current time.
+
         Returns:
             True if the deadline has not yet been reached, otherwise False.
         """
-        return self.created + self.deadline > datetime.datetime.now()
+        if now is None:
+            now = datetime.datetime.now()
+        return self.created + self.deadline > now
+
+
+class HomeworkRegistry:
+    """Keeps Homework objects ordered by their absolute expiry timestamp.
+
+    Expiry timestamps are stored in a sorted array of floats, so deadline
+    queries are answered with a binary search in O(log n + k). A single add
+    is O(n) because of the insert, so large batches should use extend.
+    """
+
+    __slots__ = ("_expiry_times", "_homeworks")
+
+    def __init__(self) -> None:
+        """Initializes an empty HomeworkRegistry instance."""
+        self._expiry_times = array("d")
+        self._homeworks: List[Homework] = []
+
+    def __len__(self) -> int:
+        """Returns the number of registered homeworks."""
+        return len(self._homeworks)
+
+    def add(self, homework: Homework) -> None:
+        """Registers a homework keeping the expiry order.
+
+        Args:
+            homework: The Homework object to register.
+        """
+        expiry_time = homework.expires_at.timestamp()
+        position = bisect_right(self._expiry_times, expiry_time)
+        self._expiry_times.insert(position, expiry_time)
+        self._homeworks.insert(position, homework)
+
+    def extend(self, homeworks: Iterable[Homework]) -> None:
+        """Registers many homeworks with one sort, in O((n + k) log(n + k)).
+
+        Homeworks with equal expiry times keep their order, after the already
+        registered ones, exactly as with repeated add calls.
+
+        Args:
+            homeworks: The Homework objects to register.
+        """
+        new_homeworks = list(homeworks)
+        expiry_times = self._expiry_times + array("d", (homework.expires_at.timestamp() for homework in new_homeworks))
+        all_homeworks = self._homeworks + new_homeworks
+        order = sorted(range(len(all_homeworks)), key=expiry_times.__getitem__)
+        self._expiry_times = array("d", (expiry_times[idx] for idx in order))
+        self._homeworks = [all_homeworks[idx] for idx in order]
+
+    def active(self, now: Optional[datetime.datetime] = None) -> List[Homework]:
+        """Returns all homeworks which are still active.
+
+        Args:
+            now: The moment to check against. Defaults to the current time.
+
+        Returns:
+            Active Homework objects ordered by expiry time.
+        """
+        if now is None:
+            now = datetime.datetime.now()
+        return self._homeworks[bisect_right(self._expiry_times, now.timestamp()) :]
+
+    def expired_since(self, since: datetime.datetime, now: Optional[datetime.datetime] = None) -> List[Homework]:
+        """Returns homeworks which expired between since and now.
+
+        Args:
+            since: The earliest expiry moment to include.
+            now: The latest expiry moment to include. Defaults to the current time.
+
+        Returns:
+            Expired Homework objects ordered by expiry time.
+        """
+        if now is None:
+            now = datetime.datetime.now()
+        start = bisect_left(self._expiry_times, since.timestamp())
+        end = bisect_right(self._expiry_times, now.timestamp())
+        return self._homeworks[start:end]
 
 
 class Teacher:
@@ -67,6 +158,8 @@ class Teacher:
         first_name (str): The first name of the teacher.
     """
 
+    __slots__ = ("last_name", "first_name")
+
     def __init__(self, last_name: str, first_name: str) -> None:
         """Initializes a Teacher instance.
 
@@ -99,6 +192,8 @@ class Student:
         first_name (str): The first name of the student.
     """
 
+    __slots__ = ("last_name", "first_name")
+
     def __init__(self, last_name: str, first_name: str) -> None:
         """Initializes a Student instance.
 
@@ -124,6 +219,61 @@ class Student:
         return homework
 
 
+class SubmissionReport:
+    """Compact result of a batch homework submission.
+
+    Attributes:
+        accepted (bytearray): One flag per submission, 1 if accepted, 0 if late.
+    """
+
+    __slots__ = ("accepted",)
+
+    def __init__(self, accepted: bytearray) -> None:
+        """Initializes a SubmissionReport instance.
+
+        Args:
+            accepted: One flag per submission, 1 if accepted, 0 if late.
+        """
+        self.accepted = accepted
+
+    @property
+    def accepted_count(self) -> int:
+        """The number of submissions made before the deadline."""
+        return self.accepted.count(1)
+
+    @property
+    def late_count(self) -> int:
+        """The number of submissions made after the deadline."""
+        return len(self.accepted) - self.accepted_count
+
+    def late_indices(self) -> array:
+        """Returns positions of the late submissions in the submitted batch."""
+        return array("q", (idx for idx, flag in enumerate(self.accepted) if not flag))
+
+
+def submit_homeworks(
+    submissions: Iterable[Tuple[Student, Homework]],
+    now: Optional[datetime.datetime] = None,
+) -> SubmissionReport:
+    """Checks a batch of (student, homework) submissions against one timestamp.
+
+    Unlike Student.do_homework nothing is printed per late submission, the
+    outcome is returned as a compact SubmissionReport instead. Like
+    do_homework, only the homework decides the outcome; the student of each
+    pair is not used.
+
+    Args:
+        submissions: Pairs of Student and Homework objects to check.
+        now: The moment to check against. Defaults to the current time.
+
+    Returns:
+        A SubmissionReport with one accepted/late flag per submission.
+    """
+    if now is None:
+        now = datetime.datetime.now()
+    return SubmissionReport(bytearray(homework.is_active(now) for _, homework in submissions))
+
+
 if __name__ == "__main__":
     teacher = Teacher("Dmitry", "Orlyakov")
     student = Student("Vladislav", "Popov")
@@ -142,3 +292,6 @@ if __name__ == "__main__":
 
     print(student.do_homework(oop_homework))
     student.do_homework(expired_homework)  # You are late
+
+    report = submit_homeworks([(student, oop_homework), (student, expired_homework)])
+    print(report.accepted_count, report.late_count)  # 1 1
@@ -15,8 +15,22 @@ In all cases it should print "Division finished"
     Division finished
 """
 
+import contextlib
+import os
+import random
+import time
 import typing
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+# Per-element status codes returned by division_many
+STATUS_OK = 0
+STATUS_DIVISION_BY_ZERO = 1
+STATUS_DIVISION_BY_ONE = 2
+
 
 class DivisionByOneException(Exception):
     pass
@@ -34,9 +48,65 @@ def division(x: int, y: int) -> typing.Union[None, int]:
             raise DivisionByOneException("Division on 1 get the same result")
 
 
+def division_many(xs: typing.Sequence[int], ys: typing.Sequence[int]) -> typing.Tuple[typing.Sequence, typing.Sequence]:
+    """Divides xs by ys element-wise without raising or printing per element.
+
+    Returns results and per-element status codes (STATUS_OK, STATUS_DIVISION_BY_ZERO,
+    STATUS_DIVISION_BY_ONE). Results for division by 0 are 0. Prints one summary line.
+    Uses numpy masks when numpy is available, plain lists otherwise.
+    """
+    if len(xs) != len(ys):
+        raise ValueError("xs and ys must have the same length")
+
+    if np is not None:
+        xs_array = np.asarray(xs)
+        ys_array = np.asarray(ys)
+        zero_mask = ys_array == 0
+        statuses = np.where(ys_array == 1, STATUS_DIVISION_BY_ONE, STATUS_OK).astype(np.int8)
+        statuses[zero_mask] = STATUS_DIVISION_BY_ZERO
+        results = np.floor_divide(xs_array, np.where(zero_mask, 1, ys_array))
+        results[zero_mask] = 0
+        counts = np.bincount(statuses, minlength=3)
+    else:
+        results = [x // y if y else 0 for x, y in zip(xs, ys)]
+        statuses = [
+            STATUS_DIVISION_BY_ZERO if y == 0 else STATUS_DIVISION_BY_ONE if y == 1 else STATUS_OK for y in ys
+        ]
+        counts = [statuses.count(status) for status in (STATUS_OK, STATUS_DIVISION_BY_ZERO, STATUS_DIVISION_BY_ONE)]
+
+    print(
+        f"Division finished: {counts[STATUS_OK]} ok, "
+        f"{counts[STATUS_DIVISION_BY_ZERO]} by 0, {counts[STATUS_DIVISION_BY_ONE]} by 1"
+    )
+    return results, statuses
+
+
+def benchmark(size: int = 10**7) -> None:
+    """Compares per-call division with division_many."""
+    xs = [random.randint(-1000, 1000) for _ in range(size)]
+    ys = [random.randint(-5, 5) for _ in range(size)]
+
+    start_time = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for x, y in zip(xs, ys):
+            try:
+                division(x, y)
+            except DivisionByOneException:
+                pass
+    print(f"division x {size}: {time.perf_counter() - start_time:.3f}s")
+
+    start_time = time.perf_counter()
+    division_many(xs, ys)
+    print(f"division_many: {time.perf_counter() - start_time:.3f}s")
+
+
 # print("-" * 30)
 # print(division(1, 0))
 # print("-" * 30)
 # print(division(2, 2))
 # print("-" * 30)
 # print(division(1, 1))
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -16,6 +16,12 @@ Examples:
 
 """
 
+import math
+import sys
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Union
+
+BLOCK_SIZE = 1024 * 1024
+
 
 def read_numbers(n: int) -> str:
     numbers = list()
@@ -31,3 +37,59 @@ def read_numbers(n: int) -> str:
         return f"Avg: {average:.2f}"
     else:
         return "No numbers entered"
+
+
+def _iter_line_batches(file_handle: BinaryIO, block_size: int) -> Iterator[List[bytes]]:
+    """Reads a file in large blocks and yields its complete lines in batches."""
+    tail = b""
+    while True:
+        block = file_handle.read(block_size)
+        if not block:
+            break
+        *lines, tail = (tail + block).split(b"\n")
+        yield lines
+    yield [tail]
+
+
+def _parse_batch(lines: Iterable[bytes]) -> List[float]:
+    """Parses a batch of lines, skipping the ones which are not numbers."""
+    try:
+        # Fast path: the whole batch is valid and parsed at C speed
+        return list(map(float, lines))
+    except ValueError:
+        numbers = []
+        for line in lines:
+            try:
+                numbers.append(float(line))
+            except ValueError:
+                pass
+        return numbers
+
+
+def read_numbers_bulk(source: Optional[Union[str, BinaryIO]] = None, block_size: int = BLOCK_SIZE) -> str:
+    """Non-interactive read_numbers for piped stdin or files of any size.
+
+    Reads source (a path or binary file, stdin by default) in large blocks, parses
+    numbers in batches and keeps only a running count and sum.
+    """
+    if source is None:
+        source = sys.stdin.buffer
+    if isinstance(source, str):
+        with open(source, "rb") as file_handle:
+            return read_numbers_bulk(file_handle, block_size)
+
+    count = 0
+    total = 0.0
+    for lines in _iter_line_batches(source, block_size):
+        numbers = _parse_batch(lines)
+        count += len(numbers)
+        total += math.fsum(numbers)
+
+    if count:
+        return f"Avg: {total / count:.2f}"
+    else:
+        return "No numbers entered"
+
+
+if __name__ == "__main__":
+    print(read_numbers_bulk())
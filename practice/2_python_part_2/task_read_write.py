@@ -15,26 +15,86 @@ Example:
 """
 
 import os
-from typing import Optional
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
 
+FILE_NAME_PATTERN = re.compile(r"file_(\d+)\.txt")
+WRITE_BUFFER_SIZE = 1024 * 1024
 
-def process_files(files_dir: str, num_of_files: int = 20, output_dir: Optional[str] = None) -> None:
+
+def discover_files(files_dir: str) -> List[str]:
+    """Finds file_N.txt files with os.scandir and returns their paths ordered by N."""
+    numbered_paths = []
+    with os.scandir(files_dir) as entries:
+        for entry in entries:
+            match = FILE_NAME_PATTERN.fullmatch(entry.name)
+            if match and entry.is_file():
+                numbered_paths.append((int(match.group(1)), entry.path))
+    return [path for _, path in sorted(numbered_paths)]
+
+
+def read_value(file_path: str) -> str:
+    with open(file_path, "r") as file_handle:
+        return file_handle.read().strip()
+
+
+def iter_values(file_paths: Iterable[str], workers: int = 1) -> Iterator[str]:
+    """Yields file contents in input order, reading up to workers files concurrently.
+
+    Only a bounded window of reads is in flight at once, so memory does not grow with the number of files.
+    """
+    if workers <= 1:
+        yield from map(read_value, file_paths)
+        return
+
+    paths_iter = iter(file_paths)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque(executor.submit(read_value, path) for path in islice(paths_iter, workers * 4))
+        while pending:
+            value = pending.popleft().result()
+            next_path = next(paths_iter, None)
+            if next_path is not None:
+                pending.append(executor.submit(read_value, next_path))
+            yield value
+
+
+def process_files(
+    files_dir: str,
+    num_of_files: Optional[int] = 20,
+    output_dir: Optional[str] = None,
+    workers: int = 1,
+    discover: bool = False,
+) -> None:
+    """Writes comma separated values of file_1.txt..file_N.txt to result.txt.
+
+    With discover the input files are found with os.scandir instead of assumed names
+    (num_of_files=None takes all of them). Values are streamed to a buffered writer.
+
+    Raises:
+        ValueError: If num_of_files is None without discover, the file names are unknown then.
+    """
+    if num_of_files is None and not discover:
+        raise ValueError("num_of_files=None requires discover=True")
     if output_dir is None:
         output_dir = files_dir
 
-    values = []
-    for i in range(1, num_of_files + 1):
-        file_path = os.path.join(files_dir, f"file_{i}.txt")
-
-        with open(file_path, "r") as file_handle:
-            content = file_handle.read().strip()
-            if content:
-                values.append(content)
+    if discover:
+        file_paths = discover_files(files_dir)[:num_of_files]
+    else:
+        file_paths = (os.path.join(files_dir, f"file_{i}.txt") for i in range(1, num_of_files + 1))
 
     output_path = f"{output_dir}/result.txt"
 
-    with open(output_path, "w") as file_handle:
-        file_handle.write(", ".join(values))
+    with open(output_path, "w", buffering=WRITE_BUFFER_SIZE) as file_handle:
+        separator = ""
+        for content in iter_values(file_paths, workers):
+            if content:
+                file_handle.write(separator)
+                file_handle.write(content)
+                separator = ", "
 
 
 if __name__ == "__main__":
@@ -12,30 +12,83 @@ Example:
 """
 
 import os
+import random
+import string
+from typing import Iterable, Iterator, List
+
+WORDS_PER_BLOCK = 64 * 1024
+BLOCK_SIZE = 1024 * 1024
+# Bytes >= 234 (26 * 9) are dropped so that byte % 26 picks letters uniformly
+LETTERS_TABLE = bytes(ord(string.ascii_lowercase[i % 26]) for i in range(256))
+BIASED_BYTES = bytes(range(26 * 9, 256))
 
 
 def generate_words(n=20):
-    import random
-    import string
+    """Lazily generates n random lowercase words of 3-10 letters.
 
-    words = list()
-    for _ in range(n):
-        word = "".join(random.choices(string.ascii_lowercase, k=random.randint(3, 10)))
-        words.append(word)
+    Letters and lengths are sliced out of large blocks of random bytes instead of
+    drawing them word by word.
+    """
+    remaining = n
+    while remaining > 0:
+        words_count = min(remaining, WORDS_PER_BLOCK)
+        lengths = [3 + byte % 8 for byte in random.randbytes(words_count)]
 
-    return words
+        letters_needed = sum(lengths)
+        letters = b""
+        while len(letters) < letters_needed:
+            letters += random.randbytes(letters_needed).translate(LETTERS_TABLE, BIASED_BYTES)
+        letters = letters.decode("ascii")
 
+        start = 0
+        for length in lengths:
+            yield letters[start : start + length]
+            start += length
+        remaining -= words_count
+
+
+def _iter_reversed_words(file_handle, block_size: int = BLOCK_SIZE) -> Iterator[List[str]]:
+    """Reads a newline separated UTF-8 file backwards in blocks and yields its words in reverse order."""
+    position = file_handle.seek(0, os.SEEK_END)
+    tail = b""
+    while position > 0:
+        read_size = min(block_size, position)
+        position -= read_size
+        file_handle.seek(position)
+        # The first part may be cut by the block border, keep it for the next block
+        tail, *words = (file_handle.read(read_size) + tail).split(b"\n")
+        if words:
+            yield [word.decode("utf-8") for word in reversed(words)]
+    yield [tail.decode("utf-8")]
 
-def main(output_dir):
-    words_list = generate_words()
 
-    output_path = os.path.join(output_dir, "results_utf8.txt")
-    with open(output_path, "w", encoding="utf-8") as file_handle:
-        file_handle.write("\n".join(words_list))
+def write_words(words: Iterable[str], output_dir, block_size: int = BLOCK_SIZE) -> None:
+    """Streams words to results_utf8.txt, then writes them reversed to results_cp1252.txt.
 
-    output_path = os.path.join(output_dir, "results_cp1252.txt")
-    with open(output_path, "w", encoding="cp1252") as file_handle:
-        file_handle.write(",".join(reversed(words_list)))
+    The reversed file is built by reading the UTF-8 file backwards block by block,
+    so the words are never held in memory all at once.
+    """
+    utf8_path = os.path.join(output_dir, "results_utf8.txt")
+    with open(utf8_path, "w", encoding="utf-8", buffering=block_size) as file_handle:
+        separator = ""
+        for word in words:
+            file_handle.write(separator)
+            file_handle.write(word)
+            separator = "\n"
+
+    cp1252_path = os.path.join(output_dir, "results_cp1252.txt")
+    with open(utf8_path, "rb") as source_handle, open(
+        cp1252_path, "w", encoding="cp1252", buffering=block_size
+    ) as file_handle:
+        separator = ""
+        for words_block in _iter_reversed_words(source_handle, block_size):
+            file_handle.write(separator)
+            file_handle.write(",".join(words_block))
+            separator = ","
+
+
+def main(output_dir):
+    write_words(generate_words(), output_dir)
 
 
 if __name__ == "__main__":
@@ -33,3 +33,26 @@ def test_files_dir(get_files_dir, tmp_path, num_of_files):
     result_path = tmp_path / "result.txt"
     process_files(get_files_dir, num_of_files, tmp_path)
     assert result_path.read_text(encoding="utf-8") == ", ".join(FILES_CONTENT[:num_of_files])
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_files_dir_with_workers(get_files_dir, tmp_path, workers):
+    result_path = tmp_path / "result.txt"
+    process_files(get_files_dir, 20, tmp_path, workers=workers)
+    assert result_path.read_text(encoding="utf-8") == ", ".join(FILES_CONTENT)
+
+
+def test_files_dir_discovered(tmp_path):
+    files_dir = tmp_path / "files"
+    files_dir.mkdir()
+    for i in range(1, 13):
+        (files_dir / f"file_{i}.txt").write_text(str(i * 10))
+    (files_dir / "notes.txt").write_text("ignored")
+
+    process_files(files_dir, None, tmp_path, workers=3, discover=True)
+    assert (tmp_path / "result.txt").read_text() == ", ".join(str(i * 10) for i in range(1, 13))
+
+
+def test_files_dir_all_files_requires_discover(get_files_dir, tmp_path):
+    with pytest.raises(ValueError, match="requires discover=True"):
+        process_files(get_files_dir, None, tmp_path)
@@ -10,6 +10,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 sys.path.append(str(Path(__file__).resolve().parents[1] / "2_python_part_2"))
+from task_read_write_2 import generate_words, write_words
 from task_read_write_2 import main as task_main
 
 words = [
@@ -52,3 +53,17 @@ def test_generate_words_cp1252(mock_input, tmp_path):
     expected_content = ",".join(reversed(words))
     assert cp1252_file_path.exists()
     assert cp1252_file_path.read_text(encoding="cp1252") == expected_content
+
+
+def test_generate_words_is_lazy_and_valid():
+    generated = generate_words(1000)
+    assert next(generated)
+    generated_words = list(generated)
+    assert len(generated_words) == 999
+    assert all(3 <= len(word) <= 10 and word.isalpha() and word.islower() for word in generated_words)
+
+
+def test_write_words_small_blocks(tmp_path):
+    write_words(iter(words), tmp_path, block_size=7)
+    assert (tmp_path / "results_utf8.txt").read_text() == "\n".join(words)
+    assert (tmp_path / "results_cp1252.txt").read_text(encoding="cp1252") == ",".join(reversed(words))
@@ -12,7 +12,7 @@ import pytest
 from freezegun import freeze_time
 
 sys.path.append(str(Path(__file__).resolve().parents[1] / "2_python_part_2"))
-from task_classes import Homework, Student, Teacher
+from task_classes import Homework, HomeworkRegistry, Student, Teacher, submit_homeworks
 
 
 @pytest.fixture
@@ -67,3 +67,62 @@ def test_student_do_expired_homework(capfd, teacher, student):
     out, err = capfd.readouterr()
     assert result is None
     assert out == "You are late\n"
+
+
+def test_classes_use_slots(teacher, student):
+    homework = teacher.create_homework("Learn slots", 1)
+    for instance in (teacher, student, homework):
+        with pytest.raises(AttributeError):
+            instance.unexpected_attribute = True
+
+
+@freeze_time("2025-06-30 12:00:00")
+def test_homework_is_active_with_shared_now(teacher):
+    homework = teacher.create_homework("Learn functions", 2)
+    assert homework.expires_at == datetime.datetime(2025, 7, 2, 12, 0, 0)
+    assert homework.is_active(datetime.datetime(2025, 7, 2, 11, 59, 59)) is True
+    assert homework.is_active(datetime.datetime(2025, 7, 2, 12, 0, 0)) is False
+
+
+@freeze_time("2025-06-30 12:00:00")
+def test_homework_registry_queries(teacher):
+    registry = HomeworkRegistry()
+    homeworks = [teacher.create_homework(f"Task {days}", days) for days in (3, 0, 1, 2, 5)]
+    for homework in homeworks:
+        registry.add(homework)
+    assert len(registry) == 5
+
+    now = datetime.datetime(2025, 7, 2, 12, 0, 0)
+    assert [homework.text for homework in registry.active(now)] == ["Task 3", "Task 5"]
+    assert [homework.text for homework in registry.expired_since(datetime.datetime(2025, 7, 1), now)] == [
+        "Task 1",
+        "Task 2",
+    ]
+    assert [homework.text for homework in registry.active()] == ["Task 1", "Task 2", "Task 3", "Task 5"]
+
+
+@freeze_time("2025-06-30 12:00:00")
+def test_homework_registry_extend_matches_add(teacher):
+    homeworks = [teacher.create_homework(f"Task {idx}", days) for idx, days in enumerate((3, 0, 1, 3, 2, 0, 5))]
+    added_registry = HomeworkRegistry()
+    for homework in homeworks:
+        added_registry.add(homework)
+    extended_registry = HomeworkRegistry()
+    extended_registry.add(homeworks[0])
+    extended_registry.extend(homeworks[1:4])
+    extended_registry.extend(iter(homeworks[4:]))
+
+    now = datetime.datetime(2025, 6, 29)
+    assert len(extended_registry) == 7
+    assert extended_registry.active(now) == added_registry.active(now)
+
+
+def test_submit_homeworks(capfd, teacher, student):
+    homeworks = [teacher.create_homework("Task", days) for days in (0, 5, 0, 1)]
+    report = submit_homeworks([(student, homework) for homework in homeworks])
+    out, err = capfd.readouterr()
+    assert out == ""
+    assert list(report.accepted) == [0, 1, 0, 1]
+    assert report.accepted_count == 2
+    assert report.late_count == 2
+    assert list(report.late_indices()) == [0, 2]
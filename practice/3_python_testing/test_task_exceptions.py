@@ -14,7 +14,15 @@ from pathlib import Path
 import pytest
 
 sys.path.append(str(Path(__file__).resolve().parents[1] / "2_python_part_2"))
-from task_exceptions import DivisionByOneException, division
+import task_exceptions
+from task_exceptions import (
+    STATUS_DIVISION_BY_ONE,
+    STATUS_DIVISION_BY_ZERO,
+    STATUS_OK,
+    DivisionByOneException,
+    division,
+    division_many,
+)
 
 
 def test_division_ok(capfd):
@@ -37,3 +45,22 @@ def test_division_by_one(capfd):
     out, err = capfd.readouterr()
     assert out == "Division finished\n"
     assert "Division on 1 get the same result" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_division_many(capfd, monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(task_exceptions, "np", None)
+    elif task_exceptions.np is None:
+        pytest.skip("numpy is not installed")
+
+    results, statuses = division_many([7, 1, 5, -9], [2, 0, 1, 4])
+    out, err = capfd.readouterr()
+    assert out == "Division finished: 2 ok, 1 by 0, 1 by 1\n"
+    assert list(results) == [3, 0, 5, -3]
+    assert list(statuses) == [STATUS_OK, STATUS_DIVISION_BY_ZERO, STATUS_DIVISION_BY_ONE, STATUS_OK]
+
+
+def test_division_many_length_mismatch():
+    with pytest.raises(ValueError):
+        division_many([1, 2], [1])
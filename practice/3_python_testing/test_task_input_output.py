@@ -18,7 +18,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 sys.path.append(str(Path(__file__).resolve().parents[1] / "2_python_part_2"))
-from task_input_output import read_numbers
+from task_input_output import read_numbers, read_numbers_bulk
 
 
 @patch("sys.stdin", new=io.StringIO("1\n2\n3\n4\n5"))
@@ -34,3 +34,18 @@ def test_read_numbers_with_text_input():
 @patch("sys.stdin", new=io.StringIO("hello\nworld\nfoo\nbar\nbaz"))
 def test_read_numbers_without_numbers():
     assert read_numbers(3) == "No numbers entered"
+
+
+def test_read_numbers_bulk_with_text_input():
+    source = io.BytesIO(b"1\n2\nhello\n2\nworld")
+    assert read_numbers_bulk(source, block_size=3) == "Avg: 1.67"
+
+
+def test_read_numbers_bulk_without_numbers():
+    assert read_numbers_bulk(io.BytesIO(b"hello\nworld\nfoo\nbar\nbaz")) == "No numbers entered"
+
+
+def test_read_numbers_bulk_from_file(tmp_path):
+    numbers_file = tmp_path / "numbers.txt"
+    numbers_file.write_text("\n".join(str(i) for i in range(1, 10001)) + "\n")
+    assert read_numbers_bulk(str(numbers_file), block_size=64) == "Avg: 5000.50"
@@ -11,7 +11,10 @@ If entered date is from future, return negative value for number of days
     WrongFormatException
 """
 
+from array import array
 from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, Optional
 
 import pytest
 from freezegun import freeze_time
@@ -21,16 +24,40 @@ class WrongFormatException(Exception):
     pass
 
 
-def calculate_days(from_date: str) -> int:
+@lru_cache(maxsize=4096)
+def parse_date(from_date: str) -> datetime:
+    """Parses a date string, memoizing results of repeated strings.
+
+    Fixed-width 'YYYY-MM-DD' strings are sliced directly, other shapes fall back to datetime.fromisoformat.
+    """
     try:
-        datetime_from_date = datetime.fromisoformat(from_date)
+        if (
+            len(from_date) == 10
+            and from_date[4] == "-"
+            and from_date[7] == "-"
+            and from_date.isascii()
+            and (from_date[:4] + from_date[5:7] + from_date[8:]).isdigit()
+        ):
+            return datetime(int(from_date[:4]), int(from_date[5:7]), int(from_date[8:]))
+        return datetime.fromisoformat(from_date)
     except ValueError as err:
         raise WrongFormatException(err)
+
+
+def calculate_days(from_date: str) -> int:
+    datetime_from_date = parse_date(from_date)
     now = datetime.now()
     days_diff = now - datetime_from_date
     return int(days_diff.days)
 
 
+def calculate_days_many(from_dates: Iterable[str], now: Optional[datetime] = None) -> array:
+    """Batch version of calculate_days which takes 'now' once for all dates and returns an int array."""
+    if now is None:
+        now = datetime.now()
+    return array("q", ((now - parse_date(from_date)).days for from_date in from_dates))
+
+
 """
 Write tests for calculate_days function
 Note that all tests should pass regardless of the day test was run
@@ -81,3 +108,30 @@ def test_wrong_format_months_days_changed():
 def test_random_string():
     with pytest.raises(WrongFormatException):
         calculate_days("fsafSD#$%^&!@fas")
+
+
+def test_parse_date_fast_path_matches_fromisoformat():
+    for from_date in ("2024-02-29", "1999-12-31", "0001-01-01"):
+        assert parse_date(from_date) == datetime.fromisoformat(from_date)
+
+
+def test_parse_date_fallback_shape():
+    assert parse_date("2024-07-02T10:30:00") == datetime(2024, 7, 2, 10, 30)
+
+
+def test_parse_date_wrong_values():
+    for from_date in ("2023-02-29", "2024-+1-03", "2024-07-0x"):
+        with pytest.raises(WrongFormatException):
+            parse_date(from_date)
+
+
+@freeze_time("2025-07-02 12:00:00")
+def test_calculate_days_many():
+    days = calculate_days_many(["2025-07-02", "2025-06-30", "2025-07-03", "2025-06-30"])
+    assert days.typecode == "q"
+    assert list(days) == [0, 2, -1, 2]
+
+
+def test_calculate_days_many_wrong_format():
+    with pytest.raises(WrongFormatException):
+        calculate_days_many(["2025-07-02", "02-07-2025"], now=datetime(2025, 7, 2))
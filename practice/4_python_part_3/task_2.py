@@ -10,24 +10,136 @@ Examples:
      11
 """
 
+import inspect
 import math
+import random
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Sequence, Tuple
 
 import pytest
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
 
 class OperationNotFoundException(Exception):
     pass
 
 
-def math_calculate(function: str, *args):
-    """Wrapper for 'math' module which allows calculations with maxiumum of 2 arguments"""
-    if len(args) > 2:
+def _get_arity(math_function: Callable) -> Tuple[int, int]:
+    """Returns the minimum and maximum number of positional arguments of a math function."""
+    try:
+        parameters = inspect.signature(math_function).parameters.values()
+    except ValueError:
+        # Some builtins (e.g. math.log) have no signature, they take 1 or 2 arguments
+        return 1, 2
+    min_args, max_args = 0, 0
+    for parameter in parameters:
+        if parameter.kind == parameter.VAR_POSITIONAL:
+            return min_args, 2
+        if parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD):
+            max_args += 1
+            if parameter.default is parameter.empty:
+                min_args += 1
+    return min_args, max_args
+
+
+def _build_dispatch_table() -> Dict[str, Tuple[Callable, int, int]]:
+    """Maps names of callable 'math' functions to (function, min arguments, max arguments)."""
+    dispatch_table = {}
+    for name, math_function in vars(math).items():
+        if not name.startswith("_") and callable(math_function):
+            dispatch_table[name] = (math_function, *_get_arity(math_function))
+    return dispatch_table
+
+
+MATH_FUNCTIONS = _build_dispatch_table()
+
+
+@lru_cache(maxsize=None)
+def resolve_operation(function: str, args_count: int) -> Callable:
+    """Finds a math function in the dispatch table and checks it accepts args_count arguments."""
+    if args_count > 2:
         raise OperationNotFoundException("Only operations with 1 or 2 arguments are allowed")
     try:
-        math_function = getattr(math, function)
-        return math_function(*args)
-    except AttributeError as err:
-        raise OperationNotFoundException(err)
+        math_function, min_args, max_args = MATH_FUNCTIONS[function]
+    except KeyError:
+        raise OperationNotFoundException(f"module 'math' has no function '{function}'")
+    if not min_args <= args_count <= max_args:
+        raise TypeError(f"math.{function} takes from {min_args} to {max_args} arguments ({args_count} given)")
+    return math_function
+
+
+def math_calculate(function: str, *args):
+    """Wrapper for 'math' module which allows calculations with maxiumum of 2 arguments"""
+    return resolve_operation(function, len(args))(*args)
+
+
+# math functions whose numpy ufunc gives bit-identical float64 results, because the operation is
+# exact or correctly rounded. numpy power, hypot, atan2 and the transcendental functions may differ
+# from libm in the last bit, and ceil or floor return floats, so those are mapped.
+UFUNC_NAMES = {
+    "sqrt": "sqrt",
+    "fabs": "fabs",
+    "copysign": "copysign",
+}
+
+
+def math_calculate_many(function: str, xs: Sequence, ys: Optional[Sequence] = None) -> list:
+    """Applies a math function element-wise to xs (and ys for 2 argument functions) and returns a list.
+
+    Functions in UFUNC_NAMES run as a numpy ufunc over float64 arrays, all others map the math
+    function. When numpy meets a domain error, overflow or division by zero, the math function
+    is mapped instead, so results and exceptions are always the same as with math_calculate.
+    """
+    args = (xs,) if ys is None else (xs, ys)
+    math_function = resolve_operation(function, len(args))
+    if np is not None and function in UFUNC_NAMES:
+        ufunc = getattr(np, UFUNC_NAMES[function])
+        if ufunc.nin == len(args):
+            try:
+                with np.errstate(all="raise"):
+                    return ufunc(*(np.asarray(arg, dtype=np.float64) for arg in args)).tolist()
+            except (FloatingPointError, OverflowError, TypeError, ValueError):
+                pass
+    return list(map(math_function, *args))
+
+
+def benchmark(size: int = 10**6) -> None:
+    """Compares the getattr based per-call path with the dispatch table and math_calculate_many."""
+
+    def getattr_calculate(function: str, *args):
+        if len(args) > 2:
+            raise OperationNotFoundException("Only operations with 1 or 2 arguments are allowed")
+        try:
+            return getattr(math, function)(*args)
+        except AttributeError as err:
+            raise OperationNotFoundException(err)
+
+    xs = [random.uniform(1, 1000) for _ in range(size)]
+
+    start_time = time.perf_counter()
+    for x in xs:
+        getattr_calculate("sqrt", x)
+    print(f"getattr per call: {time.perf_counter() - start_time:.3f}s")
+
+    start_time = time.perf_counter()
+    for x in xs:
+        math_calculate("sqrt", x)
+    print(f"math_calculate: {time.perf_counter() - start_time:.3f}s")
+
+    start_time = time.perf_counter()
+    sqrt = resolve_operation("sqrt", 1)
+    for x in xs:
+        sqrt(x)
+    print(f"resolved once: {time.perf_counter() - start_time:.3f}s")
+
+    start_time = time.perf_counter()
+    math_calculate_many("sqrt", xs)
+    print(f"math_calculate_many: {time.perf_counter() - start_time:.3f}s")
 
 
 """
@@ -52,3 +164,53 @@ def test_operation_with_more_arguments():
 def test_operation_not_found():
     with pytest.raises(OperationNotFoundException):
         math_calculate("dot", 10, 12)
+
+
+def test_constant_is_not_operation():
+    with pytest.raises(OperationNotFoundException):
+        math_calculate("pi", 1)
+
+
+def test_wrong_arity_found_before_execution():
+    with pytest.raises(TypeError, match="math.ceil takes from 1 to 1 arguments"):
+        math_calculate("ceil", 1, 2)
+
+
+def test_calculate_many_with_ufunc():
+    assert math_calculate_many("sqrt", [4, 9, 16]) == [2.0, 3.0, 4.0]
+
+
+def test_calculate_many_matches_math_calculate():
+    assert math_calculate_many("pow", [10, 2], [30, -1]) == [1e30, 0.5]
+    assert math_calculate_many("ceil", [1.5, -1.5]) == [2, -1]
+    assert all(isinstance(value, int) for value in math_calculate_many("floor", [1.5, 2.5]))
+
+
+def test_calculate_many_overflow():
+    with pytest.raises(OverflowError):
+        math_calculate_many("pow", [10.0], [400])
+    with pytest.raises(OverflowError):
+        math_calculate_many("sqrt", [10**400])
+
+
+def test_calculate_many_domain_error():
+    with pytest.raises(ValueError, match="math domain error"):
+        math_calculate_many("sqrt", [4, -1])
+    with pytest.raises(ValueError, match="math domain error"):
+        math_calculate_many("pow", [0], [-1])
+
+
+def test_calculate_many_ufunc_is_bit_identical():
+    xs = [random.uniform(-1000, 1000) for _ in range(1000)]
+    assert math_calculate_many("sqrt", [abs(x) for x in xs]) == [math.sqrt(abs(x)) for x in xs]
+    assert math_calculate_many("copysign", xs, xs[::-1]) == [math.copysign(x, y) for x, y in zip(xs, xs[::-1])]
+
+
+def test_calculate_many_without_ufunc():
+    assert math_calculate_many("log", [1024, 81], [2, 3]) == [10.0, 4.0]
+    assert math_calculate_many("factorial", [3, 5]) == [6, 120]
+    assert math_calculate_many("pow", [2, 3], [3, 2]) == [8.0, 9.0]
+
+
+if __name__ == "__main__":
+    benchmark()
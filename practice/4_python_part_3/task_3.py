@@ -10,14 +10,66 @@ Note that address may have several domain levels
     False
 """
 
+import random
 import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List
 
-# ^https?://([a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}/?$
+HTTP_DOMAIN_PATTERN = re.compile(r"^https?://([a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}/?$")
+CHUNK_SIZE = 10_000
 
 
 def is_http_domain(domain: str) -> bool:
-    pattern = r"^https?://([a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}/?$"
-    return bool(re.fullmatch(pattern, domain))
+    return HTTP_DOMAIN_PATTERN.fullmatch(domain) is not None
+
+
+def _filter_chunk(domains: List[str]) -> List[str]:
+    return list(filter(HTTP_DOMAIN_PATTERN.fullmatch, domains))
+
+
+def filter_http_domains(domains: Iterable[str], workers: int = 1, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Lazily yields valid http/https domains, keeping input order.
+
+    With workers > 1 chunks of domains are validated in a process pool with a bounded
+    number of chunks in flight, so arbitrarily long inputs use constant memory.
+    """
+    if workers <= 1:
+        yield from filter(HTTP_DOMAIN_PATTERN.fullmatch, domains)
+        return
+
+    domains_iter = iter(domains)
+    chunks = iter(lambda: list(islice(domains_iter, chunk_size)), [])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque(executor.submit(_filter_chunk, chunk) for chunk in islice(chunks, workers * 2))
+        while pending:
+            valid_domains = pending.popleft().result()
+            next_chunk = next(chunks, None)
+            if next_chunk is not None:
+                pending.append(executor.submit(_filter_chunk, next_chunk))
+            yield from valid_domains
+
+
+def benchmark(size: int = 10**6) -> None:
+    """Compares the per-call and the precompiled regex on crawl-like URLs."""
+    urls = [random.choice(["https://ru.wikipedia.org/", "http://example.com/path", "example.org"]) for _ in range(size)]
+
+    start_time = time.perf_counter()
+    for url in urls:
+        re.fullmatch(HTTP_DOMAIN_PATTERN.pattern, url)
+    print(f"re.fullmatch: {time.perf_counter() - start_time:.3f}s")
+
+    start_time = time.perf_counter()
+    for url in urls:
+        is_http_domain(url)
+    print(f"precompiled: {time.perf_counter() - start_time:.3f}s")
+
+    for workers in (1, 4):
+        start_time = time.perf_counter()
+        sum(1 for _ in filter_http_domains(urls, workers=workers))
+        print(f"filter_http_domains ({workers} workers): {time.perf_counter() - start_time:.3f}s")
 
 
 """
@@ -51,3 +103,14 @@ def test_domain_with_invalid_characters():
 
 def test_incomplete_domain():
     assert is_http_domain("https://mydomain") is False
+
+
+def test_filter_http_domains():
+    domains = ["http://wikipedia.org", "griddynamics.com", "https://ru.wikipedia.org/", "https://mydomain"] * 5
+    expected = [domain for domain in domains if is_http_domain(domain)]
+    assert list(filter_http_domains(domains)) == expected
+    assert list(filter_http_domains(iter(domains), workers=2, chunk_size=3)) == expected
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -16,22 +16,40 @@ Example:
 
 import argparse
 import json
+import random
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple
 from unittest.mock import Mock, patch
 
 from faker import Faker
 
+BATCH_SIZE = 1000
+CHUNK_SIZE = 10_000
 
-def print_name_address(args: argparse.Namespace) -> None:
-    fake = Faker()
 
-    generated_dicts = []
-    for _ in range(args.number):
+def resolve_providers(fake: Faker, field_providers: List[Tuple[str, str]]) -> List[Tuple[str, str, Callable]]:
+    """Looks up every Faker provider once, reporting and skipping the missing ones."""
+    providers = []
+    for field, provider_name in field_providers:
+        try:
+            providers.append((field, provider_name, getattr(fake, provider_name)))
+        except AttributeError:
+            print(
+                f"Error: Provider '{provider_name}' not found in Faker library. Skipping field '{field}'.",
+                file=sys.stderr,
+            )
+    return providers
+
+
+def generate_records(providers: List[Tuple[str, str, Callable]], number: int) -> Iterator[Dict]:
+    """Lazily generates number of dicts from resolved providers."""
+    for _ in range(number):
         output_dict = {}
 
-        for field, provider_name in args.field_providers:
+        for field, provider_name, provider_method in providers:
             try:
-                provider_method = getattr(fake, provider_name)
                 output_dict[field] = provider_method()
             except AttributeError:
                 print(
@@ -42,15 +60,64 @@ def print_name_address(args: argparse.Namespace) -> None:
                 print(f"An unexpected error occurred with provider '{provider_name}': {e}", file=sys.stderr)
 
         if output_dict:
-            generated_dicts.append(output_dict)
+            yield output_dict
+
 
-    for dict in generated_dicts:
-        print(json.dumps(dict))
+def write_jsonl(records: Iterator[Dict], stream: Optional[TextIO] = None, batch_size: int = BATCH_SIZE) -> None:
+    """Writes records as JSON lines, joining them into batches to keep the number of writes low."""
+    if stream is None:
+        stream = sys.stdout
+    batch = []
+    for record in records:
+        batch.append(json.dumps(record))
+        if len(batch) >= batch_size:
+            stream.write("\n".join(batch) + "\n")
+            batch.clear()
+    if batch:
+        stream.write("\n".join(batch) + "\n")
+
+
+def _generate_chunk(seed: int, field_providers: List[Tuple[str, str]], number: int) -> str:
+    """Generates a chunk of JSON lines with a separately seeded Faker instance.
+
+    field_providers must already be validated by resolve_providers in the parent process.
+    """
+    fake = Faker()
+    fake.seed_instance(seed)
+    providers = [(field, provider_name, getattr(fake, provider_name)) for field, provider_name in field_providers]
+    return "".join(json.dumps(record) + "\n" for record in generate_records(providers, number))
+
+
+def print_name_address(args: argparse.Namespace, workers: int = 1) -> None:
+    if workers <= 1:
+        fake = Faker()
+        providers = resolve_providers(fake, args.field_providers)
+        write_jsonl(generate_records(providers, args.number))
+        return
+
+    # Report missing providers once here, the workers get only the valid ones
+    providers = resolve_providers(Faker(), args.field_providers)
+    valid_providers = [(field, provider_name) for field, provider_name, _ in providers]
+    if not valid_providers:
+        return
+    chunk_sizes = [min(CHUNK_SIZE, args.number - start) for start in range(0, args.number, CHUNK_SIZE)]
+    base_seed = random.getrandbits(32)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Keep only a few chunks in flight so memory stays flat for any number of records
+        chunks = iter(enumerate(chunk_sizes))
+        pending = deque()
+        for chunk_idx, chunk_size in chunks:
+            pending.append(executor.submit(_generate_chunk, base_seed + chunk_idx, valid_providers, chunk_size))
+            if len(pending) >= workers * 2:
+                sys.stdout.write(pending.popleft().result())
+        while pending:
+            sys.stdout.write(pending.popleft().result())
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("number", type=int, help="The positive number of instances to generate.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of processes generating records.")
     try:
         known_args, unknown_args = parser.parse_known_args()
     except argparse.ArgumentError as e:
@@ -76,7 +143,7 @@ if __name__ == "__main__":
 
     known_args.field_providers = field_providers
 
-    print_name_address(known_args)
+    print_name_address(known_args, known_args.workers)
 
 """
 Write test for print_name_address function
@@ -131,6 +198,48 @@ def test_handles_invalid_provider(mock_faker_class, capsys):
     assert captured.out == ""
 
 
+@patch("task_4.Faker")
+def test_resolves_providers_once(mock_faker_class, capfd):
+    mock_faker_instance = Mock(spec=["name"])
+    mock_faker_instance.name.return_value = "Pytest User"
+    mock_faker_class.return_value = mock_faker_instance
+
+    mock_args = Mock()
+    mock_args.number = 3
+    mock_args.field_providers = [("full_name", "name"), ("missing", "no_such_provider")]
+
+    print_name_address(mock_args)
+
+    captured = capfd.readouterr()
+    assert captured.out.splitlines() == ['{"full_name": "Pytest User"}'] * 3
+    assert captured.err.count("Provider 'no_such_provider' not found") == 1
+
+
+def test_generates_records_with_workers(capfd):
+    mock_args = Mock()
+    mock_args.number = 25
+    mock_args.field_providers = [("some_name", "name")]
+
+    print_name_address(mock_args, workers=2)
+
+    output_lines = capfd.readouterr().out.splitlines()
+    assert len(output_lines) == 25
+    assert all(set(json.loads(line)) == {"some_name"} for line in output_lines)
+
+
+def test_reports_missing_provider_once_with_workers(capfd, monkeypatch):
+    monkeypatch.setattr("task_4.CHUNK_SIZE", 5)
+    mock_args = Mock()
+    mock_args.number = 25
+    mock_args.field_providers = [("some_name", "name"), ("missing", "no_such_provider")]
+
+    print_name_address(mock_args, workers=2)
+
+    captured = capfd.readouterr()
+    assert len(captured.out.splitlines()) == 25
+    assert captured.err.count("Provider 'no_such_provider' not found") == 1
+
+
 @patch("task_4.Faker")
 def test_prints_nothing_for_zero_count(mock_faker_class, capsys):
     mock_args = Mock()
@@ -6,24 +6,166 @@ Examples:
      200, 'response data'
 """
 
-from typing import Tuple
+import codecs
+import http.client
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
 from unittest.mock import Mock, patch
 from urllib import request
 from urllib.parse import urlparse
 
 import pytest
 
+CHUNK_SIZE = 64 * 1024
 
-def make_request(url: str) -> Tuple[int, str]:
+
+def _validate_scheme(url: str) -> None:
     parsed_url = urlparse(url)
     if parsed_url.scheme not in ("http", "https"):
         raise ValueError(f"Invalid URL scheme '{parsed_url.scheme}'. Only 'http' and 'https' are allowed.")
 
+
+def make_request(url: str) -> Tuple[int, str]:
+    _validate_scheme(url)
+
     with request.urlopen(url) as response:
         data = response.read().decode("utf-8")
         return response.status, data
 
 
+class ConnectionPool:
+    """Keeps idle keep-alive connections per host and limits concurrent requests to each host."""
+
+    def __init__(self, max_per_host: int = 4, timeout: float = 30) -> None:
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._idle_connections = defaultdict(list)
+        self._host_limits = defaultdict(lambda: threading.BoundedSemaphore(self.max_per_host))
+
+    @contextmanager
+    def connection(self, scheme: str, netloc: str) -> Iterator[http.client.HTTPConnection]:
+        """Lends a connection to the host, opening a new one only when no idle one is left."""
+        host_key = (scheme, netloc)
+        with self._lock:
+            host_limit = self._host_limits[host_key]
+        with host_limit:
+            with self._lock:
+                idle_connections = self._idle_connections[host_key]
+                connection = idle_connections.pop() if idle_connections else None
+            if connection is None:
+                connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+                connection = connection_class(netloc, timeout=self.timeout)
+            try:
+                yield connection
+            except BaseException:
+                connection.close()
+                raise
+            with self._lock:
+                self._idle_connections[host_key].append(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            for idle_connections in self._idle_connections.values():
+                for connection in idle_connections:
+                    connection.close()
+            self._idle_connections.clear()
+
+
+def iter_decoded_chunks(response: http.client.HTTPResponse, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Reads the response body chunk by chunk and decodes it incrementally as utf-8."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    while True:
+        chunk = response.read(chunk_size)
+        if not chunk:
+            break
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+def _pooled_request(
+    pool: ConnectionPool,
+    url_idx: int,
+    url: str,
+    as_chunks: bool,
+    chunk_size: int,
+    on_chunk: Optional[Callable[[int, str], None]],
+) -> Tuple[int, Union[str, List[str], None]]:
+    parsed_url = urlparse(url)
+    path = parsed_url.path or "/"
+    if parsed_url.query:
+        path += "?" + parsed_url.query
+
+    # A kept-alive connection may have been closed by the server meanwhile, retry once on a fresh one
+    for attempt in range(2):
+        with pool.connection(parsed_url.scheme, parsed_url.netloc) as connection:
+            chunks_delivered = False
+            try:
+                connection.request("GET", path)
+                response = connection.getresponse()
+                if on_chunk is None:
+                    chunks = list(iter_decoded_chunks(response, chunk_size))
+                else:
+                    for text in iter_decoded_chunks(response, chunk_size):
+                        chunks_delivered = True
+                        on_chunk(url_idx, text)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                connection.close()
+                # Chunks passed to on_chunk cannot be taken back, so only retry before the first one
+                if attempt or chunks_delivered:
+                    raise
+                continue
+            if response.will_close:
+                connection.close()
+            if on_chunk is not None:
+                return response.status, None
+            return response.status, chunks if as_chunks else "".join(chunks)
+
+
+def make_requests(
+    urls: Iterable[str],
+    max_per_host: int = 4,
+    workers: int = 16,
+    as_chunks: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    on_chunk: Optional[Callable[[int, str], None]] = None,
+) -> List[Tuple[int, Union[str, List[str], None]]]:
+    """Makes GET requests reusing keep-alive connections, in the order of urls.
+
+    At most max_per_host requests run against one host at a time. Bodies are decoded
+    incrementally but kept in memory, joined or, with as_chunks, as a list of decoded chunks.
+    For large bodies pass on_chunk: every decoded chunk is handed to on_chunk(url index, text)
+    as soon as it is read, in order per URL but from worker threads, and the body in the
+    result is None.
+    """
+    urls = list(urls)
+    for url in urls:
+        _validate_scheme(url)
+
+    pool = ConnectionPool(max_per_host)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    lambda url_idx, url: _pooled_request(pool, url_idx, url, as_chunks, chunk_size, on_chunk),
+                    range(len(urls)),
+                    urls,
+                )
+            )
+    finally:
+        pool.close()
+
+
 """
 Write test for make_request function
 Use Mock for mocking request with urlopen https://docs.python.org/3/library/unittest.mock.html#unittest.mock.Mock
@@ -63,3 +205,70 @@ def test_make_request_no_scheme(mock_urlopen):
     with pytest.raises(ValueError, match="Invalid URL scheme ''"):
         make_request("example.com")
     mock_urlopen.assert_not_called()
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    client_ports = set()
+
+    def do_GET(self):
+        self.client_ports.add(self.client_address[1])
+        body = ("zażółć " * 3 if self.path == "/unicode" else self.path).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    _StandInHandler.client_ports = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_make_requests_reuses_connections(local_server):
+    urls = [f"{local_server}/item/{i}?q={i}" for i in range(50)]
+    results = make_requests(urls, max_per_host=2)
+    assert results == [(200, f"/item/{i}?q={i}") for i in range(50)]
+    assert len(_StandInHandler.client_ports) <= 2
+
+
+def test_make_requests_decodes_chunks(local_server):
+    [(status, chunks)] = make_requests([f"{local_server}/unicode"], as_chunks=True, chunk_size=3)
+    assert status == 200
+    assert len(chunks) > 1
+    assert "".join(chunks) == "zażółć " * 3
+
+
+def test_make_requests_streams_chunks(local_server):
+    received = defaultdict(list)
+    urls = [f"{local_server}/unicode", f"{local_server}/plain"]
+    results = make_requests(urls, chunk_size=3, on_chunk=lambda url_idx, text: received[url_idx].append(text))
+    assert results == [(200, None), (200, None)]
+    assert len(received[0]) > 1
+    assert "".join(received[0]) == "zażółć " * 3
+    assert "".join(received[1]) == "/plain"
+
+
+def test_make_requests_invalid_scheme():
+    with pytest.raises(ValueError, match="Invalid URL scheme 'ftp'"):
+        make_requests(["http://example.com", "ftp://example.com"])
+
+
+def test_make_requests_throughput(local_server):
+    # Set THROUGHPUT_REQUESTS=10000 to measure the throughput on a realistic batch
+    requests_count = int(os.environ.get("THROUGHPUT_REQUESTS", 500))
+    start_time = time.perf_counter()
+    results = make_requests([f"{local_server}/{i}" for i in range(requests_count)], max_per_host=8)
+    duration = time.perf_counter() - start_time
+    assert all(status == 200 for status, _ in results)
+    print(f"{requests_count} requests in {duration:.2f}s ({requests_count / duration:.0f} req/s)")
@@ -0,0 +1,116 @@
+import argparse
+import json
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from main import discover_partitions, get_country_stats, iter_partition_cities, merge_partition_cities
+from serializers import SERIALIZERS, write_weather_xml
+
+SCRIPT_DIR = Path(__file__).parent
+
+
+def create_synthetic_tree(target_dir: Path, cities_count: int, hours_count: int = 24) -> None:
+    """Creates source_data-like tree with cities_count cities and random hourly readings."""
+    template = json.loads((SCRIPT_DIR / "source_data" / "Madrid" / "2021_09_25.json").read_text(encoding="utf-8"))
+    hour_template = template["hourly"][0]
+    for city_idx in range(cities_count):
+        template["hourly"] = [
+            {**hour_template, "temp": round(random.uniform(5, 35), 2), "wind_speed": round(random.uniform(0, 12), 2)}
+            for _ in range(hours_count)
+        ]
+        city_dir = target_dir / f"City_{city_idx}"
+        city_dir.mkdir(parents=True)
+        (city_dir / "2021_09_25.json").write_text(json.dumps(template), encoding="utf-8")
+
+
+def create_partitioned_tree(target_dir: Path, countries_count: int, dates_count: int, cities_count: int) -> None:
+    """Creates a <country>/<date>/<city> tree by copying one synthetic day into every partition."""
+    day_dir = target_dir / "_day"
+    create_synthetic_tree(day_dir, cities_count)
+    for country_idx in range(countries_count):
+        for date_idx in range(dates_count):
+            date_dir = target_dir / f"Country_{country_idx}" / f"2021-{date_idx // 28 + 1:02d}-{date_idx % 28 + 1:02d}"
+            shutil.copytree(day_dir, date_dir)
+    shutil.rmtree(day_dir)
+
+
+def run_pipeline(source_dir: Path, output_path: Path, workers: int) -> float:
+    """Runs the merged report path of main() without the cache and returns its duration."""
+    start_time = time.perf_counter()
+    partitions = discover_partitions(source_dir)
+    country, date, cities_data = merge_partition_cities(dict(iter_partition_cities(partitions, workers=workers)))
+    write_weather_xml(get_country_stats(cities_data), cities_data, output_path, country, date)
+    return time.perf_counter() - start_time
+
+
+def benchmark_workers(source_dir: Path, output_dir: Path, workers: int) -> None:
+    """Compares sequential and process pool runs and checks the XML reports are identical."""
+    sequential_path = output_dir / "sequential.xml"
+    parallel_path = output_dir / "parallel.xml"
+
+    print(f"sequential: {run_pipeline(source_dir, sequential_path, 1):.3f}s")
+    print(f"{workers} workers: {run_pipeline(source_dir, parallel_path, workers):.3f}s")
+    assert sequential_path.read_bytes() == parallel_path.read_bytes(), "Reports differ"
+
+
+def benchmark_formats(source_dir: Path, output_dir: Path) -> None:
+    """Times writing and reading back the report in every output format and prints the file sizes."""
+    partitions = discover_partitions(source_dir)
+    country, date, cities_data = merge_partition_cities(dict(iter_partition_cities(partitions)))
+    summary_data = get_country_stats(cities_data)
+    for format_name, serializer in SERIALIZERS.items():
+        output_path = output_dir / f"report{serializer.extension}"
+        start_time = time.perf_counter()
+        serializer.write(summary_data, cities_data, output_path, country, date)
+        write_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        read_cities = serializer.read(output_path).cities
+        read_time = time.perf_counter() - start_time
+        assert len(read_cities) == len(cities_data), f"{format_name} lost cities"
+        print(
+            f"{format_name:>6}: write {write_time:.3f}s, read {read_time:.3f}s, "
+            f"{output_path.stat().st_size / 1024:.0f} KiB"
+        )
+
+
+def benchmark_partitions(source_dir: Path, output_dir: Path, workers: int) -> None:
+    """Times writing one report per partition with the partitioned engine."""
+    start_time = time.perf_counter()
+    partitions = discover_partitions(source_dir)
+    discover_time = time.perf_counter() - start_time
+    for partition, cities_data in iter_partition_cities(partitions, workers=workers):
+        output_path = output_dir / f"{partition.country}_{partition.date}.xml"
+        write_weather_xml(get_country_stats(cities_data), cities_data, output_path, *partition)
+    total_time = time.perf_counter() - start_time
+    print(f"{len(partitions)} partitions: discovery {discover_time:.3f}s, total {total_time:.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the weather pipeline on a synthetic dataset.")
+    parser.add_argument("--cities", type=int, default=5000, help="Number of synthetic cities.")
+    parser.add_argument("--countries", type=int, default=20, help="Number of countries of the partitioned tree.")
+    parser.add_argument("--dates", type=int, default=30, help="Number of dates per country of the partitioned tree.")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="Number of worker processes.")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp())
+    try:
+        source_dir = work_dir / "source_data"
+        create_synthetic_tree(source_dir, args.cities)
+        benchmark_workers(source_dir, work_dir, args.workers)
+        benchmark_formats(source_dir, work_dir)
+
+        partitioned_dir = work_dir / "partitioned_data"
+        create_partitioned_tree(partitioned_dir, args.countries, args.dates, cities_count=17)
+        reports_dir = work_dir / "reports"
+        reports_dir.mkdir()
+        benchmark_partitions(partitioned_dir, reports_dir, args.workers)
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,35 @@
 import argparse
+import hashlib
 import json
+import math
+import os
+import warnings
+from array import array
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 from lxml import etree
 
+from serializers import SERIALIZERS
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is only needed for the columnar kernel
+    np = None
+
 # Constants for easy configuration
+# Country of the flat <city>/<YYYY_MM_DD>.json layout, which has no country directories
 COUNTRY = "Spain"
-OBSERVATION_DATE = "2021-09-25"
+READ_CHUNK_SIZE = 64 * 1024
+CACHE_VERSION = 1
+VALUE_DELIMITERS = frozenset(",:]} \t\r\n")
+SECONDS_IN_DAY = 24 * 60 * 60
+PERCENTILES = (5, 50, 95)
+FILES_PER_TASK = 256
 
 
 def get_list_of_keys(hourly_list: List, key: str) -> List:
@@ -26,6 +48,137 @@ def calculate_stats(data_list: List[float]) -> Dict[str, float]:
     }
 
 
+class RunningStats:
+    """Accumulates count, sum, min and max of a stream of numbers in constant memory."""
+
+    __slots__ = ("count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def as_dict(self) -> Dict[str, float]:
+        """Returns the same stats as calculate_stats for the numbers seen so far."""
+        if not self.count:
+            return {"mean": 0, "max": 0, "min": 0}
+        return {"mean": self.total / self.count, "max": self.max, "min": self.min}
+
+
+class _JsonStream:
+    """Minimal pull parser over a text file, decoding one JSON value at a time."""
+
+    def __init__(self, file_handle, chunk_size: int = READ_CHUNK_SIZE) -> None:
+        self.file_handle = file_handle
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+
+    def _read_more(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.file_handle.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+        return True
+
+    def next_char(self) -> str:
+        """Skips whitespace and consumes the next structural character."""
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position].isspace():
+                self.position += 1
+            if self.position < len(self.buffer):
+                self.position += 1
+                return self.buffer[self.position - 1]
+            if not self._read_more():
+                raise ValueError("Unexpected end of JSON data")
+
+    def peek_char(self) -> str:
+        char = self.next_char()
+        self.position -= 1
+        return char
+
+    def next_value(self) -> Any:
+        """Decodes the next complete JSON value, reading more data until it is complete."""
+        self.peek_char()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+                # A number cut by the chunk border (e.g. '42.' of '42.84') must be read again
+                if self.eof or (end < len(self.buffer) and self.buffer[end] in VALUE_DELIMITERS):
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._read_more()
+
+
+def iter_hourly_records(file_path: Path, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Dict]:
+    """Yields records of the top-level 'hourly' array one by one without loading the whole file."""
+    with file_path.open(encoding="utf-8") as file_handle:
+        stream = _JsonStream(file_handle, chunk_size)
+        if stream.next_char() != "{":
+            raise ValueError(f"{file_path} does not contain a JSON object")
+        if stream.peek_char() == "}":
+            return
+        while True:
+            key = stream.next_value()
+            if stream.next_char() != ":":
+                raise ValueError(f"Invalid JSON object in {file_path}")
+            if key == "hourly" and stream.peek_char() == "[":
+                stream.next_char()
+                if stream.peek_char() != "]":
+                    while True:
+                        yield stream.next_value()
+                        if stream.next_char() == "]":
+                            break
+                else:
+                    stream.next_char()
+            else:
+                stream.next_value()
+            if stream.next_char() == "}":
+                return
+
+
+def process_weather_file_streaming(file_path: Path) -> Dict[str, float]:
+    """Same as process_weather_file, but walks the hourly records in a single pass in constant memory."""
+    temp_stats = RunningStats()
+    wind_stats = RunningStats()
+    for hour_report in iter_hourly_records(file_path):
+        if "temp" in hour_report:
+            temp_stats.add(hour_report["temp"])
+        if "wind_speed" in hour_report:
+            wind_stats.add(hour_report["wind_speed"])
+    return format_city_stats(temp_stats.as_dict(), wind_stats.as_dict())
+
+
+def format_city_stats(temp_stats: Dict[str, float], wind_stats: Dict[str, float]) -> Dict[str, float]:
+    """Builds the per-city result dict with rounded means."""
+    return {
+        "mean_temp": round(temp_stats["mean"], 2),
+        "mean_wind_speed": round(wind_stats["mean"], 2),
+        "min_temp": temp_stats["min"],
+        "min_wind_speed": wind_stats["min"],
+        "max_temp": temp_stats["max"],
+        "max_wind_speed": wind_stats["max"],
+    }
+
+
 def process_weather_file(file_path: Path) -> Dict[str, float]:
     """Reads a single weather JSON file and calculates its stats."""
     with file_path.open(encoding="utf-8") as file_handle:
@@ -34,20 +187,322 @@ def process_weather_file(file_path: Path) -> Dict[str, float]:
     temps = get_list_of_keys(city_data, "temp")
     winds = get_list_of_keys(city_data, "wind_speed")
 
-    temp_stats = calculate_stats(temps)
-    wind_stats = calculate_stats(winds)
+    return format_city_stats(calculate_stats(temps), calculate_stats(winds))
+
+
+class ReadingsColumn:
+    """Contiguous float64 readings of one hourly key with their UTC timestamps.
+
+    is_int remembers which readings were integers in JSON, so min and max keep
+    the same type (and XML text) as with the list based calculate_stats.
+    """
+
+    __slots__ = ("values", "is_int", "timestamps")
+
+    def __init__(self, values: "np.ndarray", is_int: "np.ndarray", timestamps: "np.ndarray") -> None:
+        self.values = values
+        self.is_int = is_int
+        self.timestamps = timestamps
+
+    def value_at(self, idx: int) -> float:
+        value = self.values[idx].item()
+        return int(value) if self.is_int[idx] else value
+
+
+def load_city_columns(file_path: Path, streaming: bool = False) -> Dict[str, ReadingsColumn]:
+    """Reads temp and wind_speed of every hourly record into ReadingsColumn arrays."""
+    if np is None:
+        raise RuntimeError("The columnar kernel requires numpy")
+    if streaming:
+        hourly_records = iter_hourly_records(file_path)
+    else:
+        with file_path.open(encoding="utf-8") as file_handle:
+            hourly_records = json.load(file_handle).get("hourly", [])
+
+    keys = ("temp", "wind_speed")
+    values = {key: array("d") for key in keys}
+    is_int = {key: bytearray() for key in keys}
+    timestamps = {key: array("q") for key in keys}
+    for hour_report in hourly_records:
+        for key in keys:
+            if key in hour_report:
+                value = hour_report[key]
+                values[key].append(value)
+                is_int[key].append(isinstance(value, int))
+                timestamps[key].append(hour_report.get("dt", 0))
 
     return {
-        "mean_temp": round(temp_stats["mean"], 2),
-        "mean_wind_speed": round(wind_stats["mean"], 2),
-        "min_temp": temp_stats["min"],
-        "min_wind_speed": wind_stats["min"],
-        "max_temp": temp_stats["max"],
-        "max_wind_speed": wind_stats["max"],
+        key: ReadingsColumn(
+            np.frombuffer(values[key], dtype=np.float64),
+            np.frombuffer(bytes(is_int[key]), dtype=np.bool_),
+            np.frombuffer(timestamps[key], dtype=np.int64),
+        )
+        for key in keys
     }
 
 
-def get_spain_stats(cities_dict: Dict) -> Dict:
+def _column_mean(values: "np.ndarray") -> float:
+    """Mean rounding to 2 places exactly like sum(values) / len(values).
+
+    numpy sums pairwise, which may differ from the sequential sum in the last bit. That only
+    matters for the rounding when the mean is next to a tie, so then the sequential sum is used.
+    """
+    mean = float(values.sum()) / len(values)
+    scaled = mean * 100
+    if abs(scaled - math.floor(scaled) - 0.5) < 1e-6:
+        mean = sum(values.tolist()) / len(values)
+    return mean
+
+
+def calculate_column_stats(column: ReadingsColumn, extended: bool = False) -> Dict[str, float]:
+    """Vectorized calculate_stats over a ReadingsColumn.
+
+    With extended the standard deviation and PERCENTILES are added as std and p<N> keys.
+    """
+    values = column.values
+    if not len(values):
+        column_stats = {"mean": 0, "max": 0, "min": 0}
+        if extended:
+            column_stats.update({"std": 0, **{f"p{percentile}": 0 for percentile in PERCENTILES}})
+        return column_stats
+
+    column_stats = {
+        "mean": _column_mean(values),
+        "max": column.value_at(int(values.argmax())),
+        "min": column.value_at(int(values.argmin())),
+    }
+    if extended:
+        column_stats["std"] = float(values.std())
+        for percentile, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+            column_stats[f"p{percentile}"] = float(value)
+    return column_stats
+
+
+def daily_breakdown(column: ReadingsColumn) -> Dict[str, Dict[str, float]]:
+    """Returns mean, min and max of the readings for every UTC day."""
+    if not len(column.values):
+        return {}
+    days = column.timestamps // SECONDS_IN_DAY
+    order = np.argsort(days, kind="stable")
+    sorted_days = days[order]
+    sorted_values = column.values[order]
+    day_starts = np.flatnonzero(np.r_[True, sorted_days[1:] != sorted_days[:-1]])
+    counts = np.diff(np.r_[day_starts, len(sorted_values)])
+
+    means = np.add.reduceat(sorted_values, day_starts) / counts
+    mins = np.minimum.reduceat(sorted_values, day_starts)
+    maxs = np.maximum.reduceat(sorted_values, day_starts)
+    breakdown = {}
+    for day, mean, min_value, max_value in zip(sorted_days[day_starts].tolist(), means, mins, maxs):
+        day_name = datetime.fromtimestamp(day * SECONDS_IN_DAY, tz=timezone.utc).date().isoformat()
+        breakdown[day_name] = {"mean": float(mean), "min": float(min_value), "max": float(max_value)}
+    return breakdown
+
+
+def process_weather_file_columnar(file_path: Path, streaming: bool = False) -> Dict[str, float]:
+    """Same as process_weather_file, but computes the stats with the numpy columnar kernel."""
+    columns = load_city_columns(file_path, streaming)
+    return format_city_stats(
+        calculate_column_stats(columns["temp"]),
+        calculate_column_stats(columns["wind_speed"]),
+    )
+
+
+def weather_file_details(file_path: Path, streaming: bool = False) -> Dict[str, Dict]:
+    """Extended stats (std and PERCENTILES) and the daily breakdown of temp and wind_speed of one file."""
+    columns = load_city_columns(file_path, streaming)
+    return {
+        key: {**calculate_column_stats(column, extended=True), "daily": daily_breakdown(column)}
+        for key, column in columns.items()
+    }
+
+
+def hash_file(file_path: Path) -> str:
+    """Returns sha256 hex digest of the file contents."""
+    digest = hashlib.sha256()
+    with file_path.open("rb") as file_handle:
+        for chunk in iter(lambda: file_handle.read(READ_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class WeatherCache:
+    """On-disk cache of per-file city stats keyed by path, mtime, size and content hash.
+
+    Files with unchanged path, mtime and size are hits without reading them. When mtime or
+    size changed, the content hash decides, so touched but unchanged files are not recomputed.
+    """
+
+    def __init__(self, cache_path: Path, invalidate: bool = False) -> None:
+        self.cache_path = cache_path
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._used_entries = {}
+        if not invalidate and cache_path.exists():
+            try:
+                cache_data = json.loads(cache_path.read_text(encoding="utf-8"))
+                if cache_data.get("version") == CACHE_VERSION:
+                    self._entries = dict(cache_data["entries"])
+            except (ValueError, KeyError, TypeError, AttributeError) as err:
+                warnings.warn(f"Ignoring unreadable weather cache {cache_path}: {err}")
+
+    @staticmethod
+    def _file_key(file_path: Path) -> Dict[str, Any]:
+        file_stat = file_path.stat()
+        return {"mtime_ns": file_stat.st_mtime_ns, "size": file_stat.st_size}
+
+    def get(self, file_path: Path) -> Optional[Dict[str, float]]:
+        """Returns cached stats of the file, or None if it is new or changed."""
+        path_key = str(file_path.resolve())
+        entry = self._entries.get(path_key)
+        file_key = self._file_key(file_path)
+        if entry is not None and (
+            (entry["mtime_ns"], entry["size"]) == (file_key["mtime_ns"], file_key["size"])
+            or entry["sha256"] == hash_file(file_path)
+        ):
+            self.hits += 1
+            self._used_entries[path_key] = {**entry, **file_key}
+            return entry["stats"]
+        self.misses += 1
+        return None
+
+    def put(self, file_path: Path, stats: Dict[str, float]) -> None:
+        self._used_entries[str(file_path.resolve())] = {
+            **self._file_key(file_path),
+            "sha256": hash_file(file_path),
+            "stats": stats,
+        }
+
+    def save(self) -> None:
+        """Writes entries of the files seen in this run back to disk.
+
+        The cache is written to a temporary file first and then renamed over the old one,
+        so an interrupted run never leaves a truncated cache behind.
+        """
+        cache_data = {"version": CACHE_VERSION, "entries": self._used_entries}
+        temp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(cache_data), encoding="utf-8")
+        os.replace(temp_path, self.cache_path)
+
+
+class Partition(NamedTuple):
+    """One country and observation date of the source data tree."""
+
+    country: str
+    date: str
+
+
+def discover_partitions(source_dir: Path, default_country: str = COUNTRY) -> Dict[Partition, List[Path]]:
+    """Groups the JSON files of source_dir by (country, date) partition, sorted by partition.
+
+    Supports the partitioned <country>/<date>/<city>/<file>.json layout and the flat
+    <city>/<YYYY_MM_DD>.json layout, which is treated as default_country. Dates are
+    normalised to YYYY-MM-DD.
+    """
+    partitions = defaultdict(list)
+    for json_path in source_dir.glob("**/*.json"):
+        path_parts = json_path.relative_to(source_dir).parts
+        if len(path_parts) == 4:
+            partition = Partition(path_parts[0], path_parts[1].replace("_", "-"))
+        elif len(path_parts) == 2:
+            partition = Partition(default_country, json_path.stem.replace("_", "-"))
+        else:
+            raise ValueError(f"Weather file outside of the <country>/<date>/<city> layout: {json_path}")
+        partitions[partition].append(json_path)
+    return dict(sorted(partitions.items()))
+
+
+def _process_paths(process_file: Callable[[Path], Dict], json_paths: List[Path]) -> List[Dict]:
+    return [process_file(json_path) for json_path in json_paths]
+
+
+def _collect_partition(task: Tuple, cache: Optional[WeatherCache]) -> Tuple[Partition, Dict[str, Dict[str, float]]]:
+    partition, json_paths, results_by_path, chunks = task
+    for paths_chunk, processed_stats in chunks:
+        if isinstance(processed_stats, Future):
+            processed_stats = processed_stats.result()
+        for json_path, city_stats in zip(paths_chunk, processed_stats):
+            results_by_path[json_path] = city_stats
+            if cache is not None:
+                cache.put(json_path, city_stats)
+    return partition, {json_path.parent.name: results_by_path[json_path] for json_path in json_paths}
+
+
+def iter_partition_cities(
+    partitions: Dict[Partition, List[Path]],
+    process_file: Callable[[Path], Dict] = process_weather_file,
+    workers: int = 1,
+    cache: Optional[WeatherCache] = None,
+) -> Iterator[Tuple[Partition, Dict[str, Dict[str, float]]]]:
+    """Yields (partition, city stats keyed by city name) for every partition, in order.
+
+    With workers > 1 the files of every partition are split into chunks of at most
+    FILES_PER_TASK, and at least one chunk per worker, so a single large partition uses the
+    whole pool. At most workers * 4 chunks are in flight, so memory does not grow with the
+    number of countries and dates. Files found in the cache are not sent to the pool.
+    """
+    pending_tasks = deque()
+    in_flight_chunks = 0
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for partition, json_paths in partitions.items():
+            results_by_path = {}
+            if cache is not None:
+                for json_path in json_paths:
+                    cached_stats = cache.get(json_path)
+                    if cached_stats is not None:
+                        results_by_path[json_path] = cached_stats
+            paths_to_process = [json_path for json_path in json_paths if json_path not in results_by_path]
+
+            chunks = []
+            if executor is None:
+                chunks.append((paths_to_process, _process_paths(process_file, paths_to_process)))
+            else:
+                chunk_size = max(1, min(FILES_PER_TASK, math.ceil(len(paths_to_process) / workers)))
+                for chunk_start in range(0, len(paths_to_process), chunk_size):
+                    paths_chunk = paths_to_process[chunk_start : chunk_start + chunk_size]
+                    chunks.append((paths_chunk, executor.submit(_process_paths, process_file, paths_chunk)))
+            pending_tasks.append((partition, json_paths, results_by_path, chunks))
+            in_flight_chunks += len(chunks)
+
+            while pending_tasks and in_flight_chunks >= workers * 4:
+                in_flight_chunks -= len(pending_tasks[0][3])
+                yield _collect_partition(pending_tasks.popleft(), cache)
+        while pending_tasks:
+            yield _collect_partition(pending_tasks.popleft(), cache)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def merge_partition_cities(
+    partition_cities: Dict[Partition, Dict[str, Dict[str, float]]],
+) -> Tuple[str, str, Dict[str, Dict[str, float]]]:
+    """Rolls the cities of all partitions up into one report.
+
+    Returns the country and date attributes of the report ("Spain,France" and ISO 8601
+    "2021-09-25/2021-09-27" intervals for several values) and the cities. City names get
+    a ".<country>" and ".<date>" suffix only when the partitions differ in it, so one
+    partition keeps plain names. The city stats dicts are shared, not copied.
+    """
+    countries = sorted({partition.country for partition in partition_cities})
+    dates = sorted({partition.date for partition in partition_cities})
+    merged_cities = {}
+    for partition, cities_data in partition_cities.items():
+        suffix = ""
+        if len(countries) > 1:
+            suffix += f".{partition.country}"
+        if len(dates) > 1:
+            suffix += f".{partition.date}"
+        for city_name, city_stats in cities_data.items():
+            merged_cities[city_name + suffix] = city_stats
+
+    date = dates[0] if len(dates) == 1 else f"{dates[0]}/{dates[-1]}"
+    return ",".join(countries), date, merged_cities
+
+
+def get_country_stats(cities_dict: Dict) -> Dict:
     """Aggregates stats for all cities to find country-wide extremes and averages."""
     if not cities_dict:
         return {}
@@ -87,9 +542,9 @@ def get_spain_stats(cities_dict: Dict) -> Dict:
     }
 
 
-def create_weather_xml(summary_data: Dict, cities_data: Dict) -> etree._Element:
+def create_weather_xml(summary_data: Dict, cities_data: Dict, country: str, date: str) -> etree._Element:
     """Builds the XML structure from the processed weather data."""
-    root = etree.Element("weather", country=COUNTRY, date=OBSERVATION_DATE)
+    root = etree.Element("weather", country=country, date=date)
 
     summary_attribs = {key: str(value) for key, value in summary_data.items()}
     etree.SubElement(root, "summary", attrib=summary_attribs)
@@ -126,27 +581,115 @@ def main():
     parser.add_argument(
         "-o",
         "--output",
-        default=str(script_dir / "result.xml"),
-        help="Path to save the final result.xml file.",
+        help=(
+            "Path to save the result file (default: result.<format extension> next to this script), "
+            "or the reports directory with --report partition (default: reports next to this script)."
+        ),
+    )
+    parser.add_argument(
+        "-r",
+        "--report",
+        choices=("merged", "partition"),
+        default="merged",
+        help="Write one report rolling up all countries and dates, or one report per country and date.",
+    )
+    parser.add_argument(
+        "--country",
+        default=COUNTRY,
+        help="Country of the flat <city>/<YYYY_MM_DD>.json source layout.",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=sorted(SERIALIZERS),
+        default="xml",
+        help="Output format of the report.",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Parse hourly records incrementally, in constant memory per file.",
+    )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Compute stats with the numpy columnar kernel.",
+    )
+    parser.add_argument(
+        "--details",
+        help="Also save std-dev, percentiles and the daily breakdown of every city to this JSON file (needs numpy).",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to process the JSON files.",
+    )
+    parser.add_argument(
+        "--cache",
+        default=str(script_dir / ".weather_cache.json"),
+        help="Path to the per-file results cache.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the per-file results cache.",
+    )
+    parser.add_argument(
+        "--invalidate-cache",
+        action="store_true",
+        help="Ignore the existing cache and recompute every file.",
     )
     args = parser.parse_args()
 
+    serializer = SERIALIZERS[args.format]
     source_dir = Path(args.source)
-    output_path = Path(args.output)
 
     # Process all JSON files
-    weather_cities_data = {}
-    for json_file_path in source_dir.glob("**/*.json"):
-        weather_cities_data[json_file_path.parent.name] = process_weather_file(json_file_path)
-
-    # Aggregate country-wide statistics
-    spain_data_dict = get_spain_stats(weather_cities_data)
-
-    # Create and save the final XML file
-    weather_xml_root = create_weather_xml(spain_data_dict, weather_cities_data)
-    save_xml_file(weather_xml_root, output_path)
-
-    print(f"Successfully saved weather data to {output_path}")
+    if (args.columnar or args.details) and np is None:
+        parser.error("--columnar and --details require numpy")
+    if args.columnar:
+        process_file = partial(process_weather_file_columnar, streaming=args.streaming)
+    elif args.streaming:
+        process_file = process_weather_file_streaming
+    else:
+        process_file = process_weather_file
+    partitions = discover_partitions(source_dir, args.country)
+    if not partitions:
+        parser.error(f"No weather files found in {source_dir}")
+    cache = None if args.no_cache else WeatherCache(Path(args.cache), invalidate=args.invalidate_cache)
+    partition_cities = iter_partition_cities(partitions, process_file, args.workers, cache)
+
+    if args.report == "partition":
+        # Every report is written as soon as its partition is processed
+        output_dir = Path(args.output) if args.output else script_dir / "reports"
+        for partition, cities_data in partition_cities:
+            output_path = output_dir / partition.country / partition.date / f"result{serializer.extension}"
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            serializer.write(get_country_stats(cities_data), cities_data, output_path, *partition)
+        saved_to = f"{len(partitions)} partition reports in {output_dir}"
+    else:
+        # Aggregate the statistics of all partitions into one report
+        country, date, cities_data = merge_partition_cities(dict(partition_cities))
+        output_path = Path(args.output) if args.output else script_dir / f"result{serializer.extension}"
+        serializer.write(get_country_stats(cities_data), cities_data, output_path, country, date)
+        saved_to = str(output_path)
+
+    if cache is not None:
+        cache.save()
+        print(f"Cache hits: {cache.hits}, misses: {cache.misses}")
+
+    if args.details:
+        details_file = partial(weather_file_details, streaming=args.streaming)
+        details = {
+            f"{partition.country}/{partition.date}": cities_details
+            for partition, cities_details in iter_partition_cities(partitions, details_file, args.workers)
+        }
+        Path(args.details).write_text(json.dumps(details, indent=2), encoding="utf-8")
+        print(f"Saved city details to {args.details}")
+
+    print(f"Successfully saved weather data to {saved_to}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,242 @@
+import csv
+import itertools
+import json
+import struct
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, Iterable, NamedTuple, Tuple, Union
+
+from lxml import etree
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pa = None
+    pq = None
+
+CityItems = Union[Dict[str, Dict], Iterable[Tuple[str, Dict]]]
+
+CITY_FIELDS = ("mean_temp", "mean_wind_speed", "min_temp", "min_wind_speed", "max_temp", "max_wind_speed")
+SUMMARY_FIELDS = ("mean_temp", "mean_wind_speed", "coldest_place", "warmest_place", "windiest_place")
+SUMMARY_PLACE_FIELDS = ("coldest_place", "warmest_place", "windiest_place")
+CSV_FIELDS = ("record_type", "name", "date") + CITY_FIELDS + SUMMARY_PLACE_FIELDS
+
+BINARY_MAGIC = b"WTHRCOL1"
+# magic, header JSON length, number of cities
+BINARY_PREFIX = struct.Struct("<8sII")
+
+
+class WeatherReport(NamedTuple):
+    """A report read back from any format.
+
+    Stats are floats and places are strings whatever the format stored, and a report
+    written with an empty summary has an empty summary dict.
+    """
+
+    country: str
+    date: str
+    summary: Dict[str, Union[float, str]]
+    cities: Dict[str, Dict[str, float]]
+
+
+class Serializer(NamedTuple):
+    """Writer and reader of one report format."""
+
+    extension: str
+    write: Callable[[Dict, CityItems, Path, str, str], None]
+    read: Callable[[Path], WeatherReport]
+
+
+def _iter_cities(cities_data: CityItems) -> Iterable[Tuple[str, Dict]]:
+    return cities_data.items() if isinstance(cities_data, dict) else cities_data
+
+
+def _make_report(country: str, date: str, summary: Dict, cities: Dict[str, Dict]) -> WeatherReport:
+    """Converts values read from a file to the WeatherReport types, skipping empty summary fields."""
+    summary = {
+        key: str(summary[key]) if key in SUMMARY_PLACE_FIELDS else float(summary[key])
+        for key in SUMMARY_FIELDS
+        if summary.get(key) not in (None, "")
+    }
+    cities = {city_name: {field: float(values[field]) for field in CITY_FIELDS} for city_name, values in cities.items()}
+    return WeatherReport(country, date, summary, cities)
+
+
+def write_weather_xml(
+    summary_data: Dict, cities_data: CityItems, file_path: Path, country: str, date: str
+) -> None:
+    """Streams the weather XML straight to file_path with etree.xmlfile.
+
+    Produces the same bytes as create_weather_xml + save_xml_file, but writes every city
+    element as it comes instead of building the whole tree, so memory does not depend on
+    the number of cities. cities_data may be a dict or an iterable of (city, stats) pairs.
+    """
+    cities_items = iter(_iter_cities(cities_data))
+    first_city = next(cities_items, None)
+
+    with file_path.open("wb") as file_handle:
+        # lxml does not allow text outside the root element, so the declaration line and
+        # the final newline are written to the file directly
+        file_handle.write(b"<?xml version='1.0' encoding='utf-8'?>\n")
+        with etree.xmlfile(file_handle, encoding="utf-8") as xml_file:
+            with xml_file.element("weather", country=country, date=date):
+                summary_attribs = {key: str(value) for key, value in summary_data.items()}
+                xml_file.write("\n  ", etree.Element("summary", attrib=summary_attribs), "\n  ")
+                if first_city is None:
+                    xml_file.write(etree.Element("cities"))
+                else:
+                    with xml_file.element("cities"):
+                        for city_name, values in itertools.chain((first_city,), cities_items):
+                            city_attribs = {key: str(value) for key, value in values.items()}
+                            # Replace spaces in city names to create valid XML tag names
+                            valid_tag_name = city_name.replace(" ", "_")
+                            xml_file.write("\n    ", etree.Element(valid_tag_name, attrib=city_attribs))
+                        xml_file.write("\n  ")
+                xml_file.write("\n")
+        file_handle.write(b"\n")
+
+
+def read_weather_xml(file_path: Path) -> WeatherReport:
+    """Reads a weather XML report. Underscores of the city tags are read back as spaces."""
+    root = etree.parse(str(file_path)).getroot()
+    summary = dict(root.find("summary").attrib)
+    cities = {city.tag.replace("_", " "): dict(city.attrib) for city in root.find("cities")}
+    return _make_report(root.get("country"), root.get("date"), summary, cities)
+
+
+def write_weather_csv(summary_data: Dict, cities_data: CityItems, file_path: Path, country: str, date: str) -> None:
+    """Writes one 'summary' row named after the country, with the date, and one 'city' row per city."""
+    with file_path.open("w", newline="", encoding="utf-8") as file_handle:
+        writer = csv.DictWriter(file_handle, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerow({"record_type": "summary", "name": country, "date": date, **summary_data})
+        for city_name, values in _iter_cities(cities_data):
+            writer.writerow({"record_type": "city", "name": city_name, **values})
+
+
+def read_weather_csv(file_path: Path) -> WeatherReport:
+    country, date, summary, cities = "", "", {}, {}
+    with file_path.open(newline="", encoding="utf-8") as file_handle:
+        for row in csv.DictReader(file_handle):
+            if row["record_type"] == "summary":
+                country, date = row["name"], row["date"]
+                summary = row
+            else:
+                cities[row["name"]] = row
+    return _make_report(country, date, summary, cities)
+
+
+def write_weather_jsonl(summary_data: Dict, cities_data: CityItems, file_path: Path, country: str, date: str) -> None:
+    """Writes the summary as the first JSON line and then one JSON line per city."""
+    with file_path.open("w", encoding="utf-8") as file_handle:
+        summary_record = {"type": "summary", "country": country, "date": date, **summary_data}
+        file_handle.write(json.dumps(summary_record) + "\n")
+        for city_name, values in _iter_cities(cities_data):
+            file_handle.write(json.dumps({"type": "city", "name": city_name, **values}) + "\n")
+
+
+def read_weather_jsonl(file_path: Path) -> WeatherReport:
+    summary, cities = {}, {}
+    with file_path.open(encoding="utf-8") as file_handle:
+        for line in file_handle:
+            record = json.loads(line)
+            if record["type"] == "summary":
+                summary = record
+            else:
+                cities[record["name"]] = record
+    return _make_report(summary.get("country", ""), summary.get("date", ""), summary, cities)
+
+
+def write_weather_struct(summary_data: Dict, cities_data: CityItems, file_path: Path, country: str, date: str) -> None:
+    """Writes a columnar binary file: a JSON header, a fixed-width names column and one float64 column per field.
+
+    Layout: BINARY_PREFIX (magic, header length, cities count), header JSON, cities count x
+    name_width utf-8 names padded with zero bytes, then CITY_FIELDS columns of little-endian doubles.
+    name_width is the length of the longest encoded name and is stored in the header.
+    """
+    encoded_names = []
+    columns = {field: array("d") for field in CITY_FIELDS}
+    for city_name, values in _iter_cities(cities_data):
+        encoded_names.append(city_name.encode("utf-8"))
+        for field in CITY_FIELDS:
+            columns[field].append(values[field])
+    name_width = max(1, max(map(len, encoded_names), default=0))
+    names = b"".join(encoded_name.ljust(name_width, b"\0") for encoded_name in encoded_names)
+
+    header = {
+        "country": country,
+        "date": date,
+        "summary": summary_data,
+        "name_width": name_width,
+        "fields": CITY_FIELDS,
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    with file_path.open("wb") as file_handle:
+        file_handle.write(BINARY_PREFIX.pack(BINARY_MAGIC, len(header_bytes), len(encoded_names)))
+        file_handle.write(header_bytes)
+        file_handle.write(names)
+        for field in CITY_FIELDS:
+            # array has no byte order option, the format is defined as little-endian
+            if struct.pack("=d", 1.0) != struct.pack("<d", 1.0):
+                columns[field].byteswap()
+            file_handle.write(columns[field].tobytes())
+
+
+def read_weather_struct(file_path: Path) -> WeatherReport:
+    with file_path.open("rb") as file_handle:
+        magic, header_length, cities_count = BINARY_PREFIX.unpack(file_handle.read(BINARY_PREFIX.size))
+        if magic != BINARY_MAGIC:
+            raise ValueError(f"{file_path} is not a weather columnar file")
+        header = json.loads(file_handle.read(header_length))
+        name_width = header["name_width"]
+        names_column = file_handle.read(cities_count * name_width)
+        names = [
+            names_column[start : start + name_width].rstrip(b"\0").decode("utf-8")
+            for start in range(0, len(names_column), name_width)
+        ]
+        columns = {}
+        for field in header["fields"]:
+            column = array("d")
+            column.frombytes(file_handle.read(cities_count * column.itemsize))
+            if struct.pack("=d", 1.0) != struct.pack("<d", 1.0):
+                column.byteswap()
+            columns[field] = column
+    cities = {name: {field: columns[field][idx] for field in header["fields"]} for idx, name in enumerate(names)}
+    return _make_report(header["country"], header["date"], header["summary"], cities)
+
+
+def write_weather_parquet(summary_data: Dict, cities_data: CityItems, file_path: Path, country: str, date: str) -> None:
+    """Writes the cities table to Parquet, with country, date and summary in the schema metadata."""
+    cities = list(_iter_cities(cities_data))
+    table = pa.table(
+        {
+            "name": [city_name for city_name, _ in cities],
+            **{field: pa.array([values[field] for _, values in cities], pa.float64()) for field in CITY_FIELDS},
+        }
+    )
+    metadata = {"country": country, "date": date, "summary": json.dumps(summary_data)}
+    pq.write_table(table.replace_schema_metadata(metadata), str(file_path))
+
+
+def read_weather_parquet(file_path: Path) -> WeatherReport:
+    table = pq.read_table(str(file_path))
+    metadata = table.schema.metadata
+    summary = json.loads(metadata[b"summary"])
+    columns = table.to_pydict()
+    cities = {
+        name: {field: columns[field][idx] for field in CITY_FIELDS} for idx, name in enumerate(columns["name"])
+    }
+    return _make_report(metadata[b"country"].decode("utf-8"), metadata[b"date"].decode("utf-8"), summary, cities)
+
+
+SERIALIZERS = {
+    "xml": Serializer(".xml", write_weather_xml, read_weather_xml),
+    "csv": Serializer(".csv", write_weather_csv, read_weather_csv),
+    "jsonl": Serializer(".jsonl", write_weather_jsonl, read_weather_jsonl),
+    "binary": (
+        Serializer(".parquet", write_weather_parquet, read_weather_parquet)
+        if pa is not None
+        else Serializer(".bin", write_weather_struct, read_weather_struct)
+    ),
+}
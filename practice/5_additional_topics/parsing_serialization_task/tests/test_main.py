@@ -0,0 +1,254 @@
+import json
+import shutil
+import statistics
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from main import (
+    Partition,
+    WeatherCache,
+    calculate_column_stats,
+    daily_breakdown,
+    discover_partitions,
+    iter_partition_cities,
+    iter_hourly_records,
+    load_city_columns,
+    merge_partition_cities,
+    process_weather_file,
+    process_weather_file_columnar,
+    process_weather_file_streaming,
+    weather_file_details,
+)
+
+SOURCE_DIR = Path(__file__).resolve().parents[1] / "source_data"
+
+
+def write_city(city_dir: Path, file_name: str, temps):
+    city_dir.mkdir(parents=True)
+    hourly = [{"temp": temp, "wind_speed": 1.5} for temp in temps]
+    (city_dir / file_name).write_text(json.dumps({"hourly": hourly}), encoding="utf-8")
+
+
+WEATHER_DOCUMENT = {
+    "lat": 40.4165,
+    "lon": -3.7026,
+    "timezone": "Europe/Madrid",
+    "current": {"hourly": [{"temp": -1}], "note": "not the top-level \"hourly\" ]}"},
+    "hourly": [
+        {"dt": 1632528000, "temp": 17.89, "wind_speed": 2, "weather": [{"description": "cielo claro"}]},
+        {"dt": 1632531600, "temp": -0.125e1, "wind_speed": 12.5, "name": "zażółć [\u00e9] {x}: ,"},
+        {"dt": 1632535200, "temp": 1e-3, "wind_speed": 0, "rain": None, "snow": False, "gusts": True},
+        {},
+    ],
+    "tail": [1234567.891, "end"],
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 64, 1024])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_hourly_records_matches_json_load(tmp_path, chunk_size, indent):
+    json_path = tmp_path / "data.json"
+    json_path.write_text(json.dumps(WEATHER_DOCUMENT, indent=indent, ensure_ascii=False), encoding="utf-8")
+
+    with json_path.open(encoding="utf-8") as file_handle:
+        expected_records = json.load(file_handle)["hourly"]
+    assert list(iter_hourly_records(json_path, chunk_size)) == expected_records
+
+
+@pytest.mark.parametrize("document", ['{"hourly": []}', "{}", '{"other": {"hourly": [1]}}', ' {"hourly" : [ {} ] } '])
+def test_iter_hourly_records_edge_documents(tmp_path, document):
+    json_path = tmp_path / "data.json"
+    json_path.write_text(document, encoding="utf-8")
+
+    for chunk_size in (1, 4, 1024):
+        assert list(iter_hourly_records(json_path, chunk_size)) == json.loads(document).get("hourly", [])
+
+
+@pytest.mark.parametrize("document", ["[]", '{"hourly": [{"temp": 1}', '{"hourly": [{"temp": 1.}]}'])
+def test_iter_hourly_records_invalid_documents(tmp_path, document):
+    json_path = tmp_path / "data.json"
+    json_path.write_text(document, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        list(iter_hourly_records(json_path, chunk_size=3))
+
+
+def test_process_weather_file_streaming_matches_json_load():
+    for json_path in SOURCE_DIR.glob("*/*.json"):
+        assert process_weather_file_streaming(json_path) == process_weather_file(json_path)
+
+
+@pytest.fixture
+def partitioned_tree(tmp_path):
+    write_city(tmp_path / "Spain" / "2021-09-25" / "Madrid", "data.json", [10, 20])
+    write_city(tmp_path / "Spain" / "2021_09_26" / "Madrid", "data.json", [12, 14])
+    write_city(tmp_path / "France" / "2021-09-25" / "Paris", "data.json", [8, 9])
+    write_city(tmp_path / "France" / "2021-09-25" / "Lyon", "data.json", [15, 17])
+    return tmp_path
+
+
+def test_discover_partitions(partitioned_tree):
+    partitions = discover_partitions(partitioned_tree)
+
+    assert list(partitions) == [
+        Partition("France", "2021-09-25"),
+        Partition("Spain", "2021-09-25"),
+        Partition("Spain", "2021-09-26"),
+    ]
+    assert sorted(path.parent.name for path in partitions[Partition("France", "2021-09-25")]) == ["Lyon", "Paris"]
+
+
+def test_discover_partitions_flat_layout(tmp_path):
+    write_city(tmp_path / "Madrid", "2021_09_25.json", [10])
+    write_city(tmp_path / "Seville", "2021_09_25.json", [20])
+
+    partitions = discover_partitions(tmp_path, default_country="Spain")
+
+    assert list(partitions) == [Partition("Spain", "2021-09-25")]
+    assert len(partitions[Partition("Spain", "2021-09-25")]) == 2
+
+
+def test_discover_partitions_rejects_other_layouts(tmp_path):
+    write_city(tmp_path / "Spain" / "Madrid", "data.json", [10])
+
+    with pytest.raises(ValueError, match="layout"):
+        discover_partitions(tmp_path)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_iter_partition_cities(partitioned_tree, workers):
+    partitions = discover_partitions(partitioned_tree)
+
+    partition_cities = dict(iter_partition_cities(partitions, workers=workers))
+
+    assert list(partition_cities) == list(partitions)
+    assert partition_cities[Partition("Spain", "2021-09-25")]["Madrid"]["mean_temp"] == 15
+    assert partition_cities[Partition("Spain", "2021-09-26")]["Madrid"]["max_temp"] == 14
+
+
+def test_iter_partition_cities_matches_process_weather_file(tmp_path):
+    shutil.copytree(SOURCE_DIR, tmp_path / "source_data")
+    partitions = discover_partitions(tmp_path / "source_data")
+
+    ((partition, cities_data),) = iter_partition_cities(partitions, workers=3)
+
+    assert partition == Partition("Spain", "2021-09-25")
+    assert cities_data == {path.parent.name: process_weather_file(path) for path in partitions[partition]}
+
+
+def test_merge_partition_cities(partitioned_tree):
+    partition_cities = dict(iter_partition_cities(discover_partitions(partitioned_tree)))
+
+    country, date, cities_data = merge_partition_cities(partition_cities)
+
+    assert (country, date) == ("France,Spain", "2021-09-25/2021-09-26")
+    assert sorted(cities_data) == [
+        "Lyon.France.2021-09-25",
+        "Madrid.Spain.2021-09-25",
+        "Madrid.Spain.2021-09-26",
+        "Paris.France.2021-09-25",
+    ]
+    assert cities_data["Madrid.Spain.2021-09-25"] is partition_cities[Partition("Spain", "2021-09-25")]["Madrid"]
+
+
+def test_merge_single_partition_keeps_city_names(partitioned_tree):
+    partitions = discover_partitions(partitioned_tree)
+    france = Partition("France", "2021-09-25")
+
+    country, date, cities_data = merge_partition_cities(dict(iter_partition_cities({france: partitions[france]})))
+
+    assert (country, date) == ("France", "2021-09-25")
+    assert sorted(cities_data) == ["Lyon", "Paris"]
+
+
+def test_weather_cache_hits_after_save(tmp_path):
+    write_city(tmp_path / "Madrid", "data.json", [10, 20])
+    json_path = tmp_path / "Madrid" / "data.json"
+    cache_path = tmp_path / "cache.json"
+    cache = WeatherCache(cache_path)
+    assert cache.get(json_path) is None
+    cache.put(json_path, process_weather_file(json_path))
+    cache.save()
+
+    reloaded_cache = WeatherCache(cache_path)
+    assert reloaded_cache.get(json_path) == process_weather_file(json_path)
+    assert (reloaded_cache.hits, reloaded_cache.misses) == (1, 0)
+    assert [path.name for path in tmp_path.iterdir() if path.is_file()] == ["cache.json"]
+
+
+def test_weather_cache_misses_changed_file(tmp_path):
+    write_city(tmp_path / "Madrid", "data.json", [10, 20])
+    json_path = tmp_path / "Madrid" / "data.json"
+    cache = WeatherCache(tmp_path / "cache.json")
+    cache.put(json_path, process_weather_file(json_path))
+    cache.save()
+
+    json_path.write_text(json.dumps({"hourly": [{"temp": 1, "wind_speed": 1}, {"temp": 30, "wind_speed": 2}]}))
+    assert WeatherCache(tmp_path / "cache.json").get(json_path) is None
+
+
+@pytest.mark.parametrize("cache_text", ['{"version": 1, "entries": {"a', "[]", '{"version": 1}'])
+def test_weather_cache_ignores_corrupt_file(tmp_path, cache_text):
+    write_city(tmp_path / "Madrid", "data.json", [10, 20])
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_text(cache_text, encoding="utf-8")
+
+    with pytest.warns(UserWarning, match="Ignoring unreadable weather cache"):
+        cache = WeatherCache(cache_path)
+
+    assert cache.get(tmp_path / "Madrid" / "data.json") is None
+    cache.save()
+    assert WeatherCache(cache_path).misses == 0
+
+
+def write_hourly(json_path: Path, hourly):
+    json_path.write_text(json.dumps({"hourly": hourly}), encoding="utf-8")
+
+
+def test_calculate_column_stats_extended(tmp_path):
+    np = pytest.importorskip("numpy")
+    temps = [12, 14.5, 9.25, 20, 17.75, 11]
+    hourly = [{"dt": idx * 3600, "temp": temp, "wind_speed": 1} for idx, temp in enumerate(temps)]
+    write_hourly(tmp_path / "data.json", hourly)
+
+    column_stats = calculate_column_stats(load_city_columns(tmp_path / "data.json")["temp"], extended=True)
+
+    assert column_stats["mean"] == pytest.approx(statistics.fmean(temps))
+    assert (column_stats["min"], column_stats["max"]) == (9.25, 20)
+    assert column_stats["std"] == pytest.approx(statistics.pstdev(temps))
+    assert column_stats["p50"] == pytest.approx(statistics.median(temps))
+    assert [column_stats["p5"], column_stats["p95"]] == pytest.approx(np.percentile(temps, [5, 95]).tolist())
+
+
+def test_daily_breakdown_splits_utc_days(tmp_path):
+    pytest.importorskip("numpy")
+    day = 24 * 60 * 60
+    hourly = [
+        {"dt": day - 3600, "temp": 10},
+        {"dt": day, "temp": 20},
+        {"dt": 0, "temp": 4},
+        {"dt": day + 7200, "temp": 30},
+    ]
+    write_hourly(tmp_path / "data.json", hourly)
+
+    breakdown = daily_breakdown(load_city_columns(tmp_path / "data.json")["temp"])
+
+    assert breakdown == {
+        "1970-01-01": {"mean": 7.0, "min": 4.0, "max": 10.0},
+        "1970-01-02": {"mean": 25.0, "min": 20.0, "max": 30.0},
+    }
+
+
+def test_weather_file_details_and_columnar_stats():
+    pytest.importorskip("numpy")
+    json_path = SOURCE_DIR / "Madrid" / "2021_09_25.json"
+
+    details = weather_file_details(json_path)
+
+    assert process_weather_file_columnar(json_path) == process_weather_file(json_path)
+    assert list(details) == ["temp", "wind_speed"]
+    assert list(details["temp"]["daily"]) == ["2021-09-25"]
+    assert details["temp"]["min"] == process_weather_file(json_path)["min_temp"]
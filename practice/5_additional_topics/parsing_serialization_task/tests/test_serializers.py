@@ -0,0 +1,119 @@
+import sys
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from main import create_weather_xml, save_xml_file
+from serializers import SERIALIZERS, WeatherReport, read_weather_struct, write_weather_struct, write_weather_xml
+
+SUMMARY = {
+    "mean_temp": 20.43,
+    "mean_wind_speed": 2.11,
+    "coldest_place": "Santa Cruz de Tenerife",
+    "warmest_place": "Logroño",
+    "windiest_place": "Logroño",
+}
+CITIES = {
+    "Santa Cruz de Tenerife": {
+        "mean_temp": 17.89,
+        "mean_wind_speed": 1.99,
+        "min_temp": 14,
+        "min_wind_speed": 0,
+        "max_temp": 22.95,
+        "max_wind_speed": 7.2,
+    },
+    "Logroño": {
+        "mean_temp": 23.1,
+        "mean_wind_speed": 3.5,
+        "min_temp": -1.5,
+        "min_wind_speed": 0.45,
+        "max_temp": 31,
+        "max_wind_speed": 12.25,
+    },
+}
+
+EXAMPLE_RESULT = Path(__file__).resolve().parent / "example_result.xml"
+
+FORMATS = [(name, serializer.write, serializer.read) for name, serializer in SERIALIZERS.items()]
+FORMATS.append(("struct", write_weather_struct, read_weather_struct))
+
+
+def assert_same_types(report: WeatherReport):
+    assert all(isinstance(value, str) for key, value in report.summary.items() if key.endswith("_place"))
+    assert all(isinstance(value, float) for key, value in report.summary.items() if key.startswith("mean_"))
+    assert all(isinstance(value, float) for values in report.cities.values() for value in values.values())
+
+
+@pytest.mark.parametrize("format_name, write, read", FORMATS)
+def test_round_trip(tmp_path, format_name, write, read):
+    file_path = tmp_path / f"report.{format_name}"
+    write(SUMMARY, CITIES, file_path, "Spain", "2021-09-25")
+
+    report = read(file_path)
+
+    assert report == WeatherReport("Spain", "2021-09-25", SUMMARY, CITIES)
+    assert list(report.cities) == list(CITIES)
+    assert_same_types(report)
+
+
+@pytest.mark.parametrize("format_name, write, read", FORMATS)
+def test_round_trip_empty_report(tmp_path, format_name, write, read):
+    file_path = tmp_path / f"report.{format_name}"
+    write({}, {}, file_path, "Spain", "2021-09-25")
+
+    assert read(file_path) == WeatherReport("Spain", "2021-09-25", {}, {})
+
+
+@pytest.mark.parametrize("format_name, write, read", FORMATS)
+def test_round_trip_accepts_city_pairs(tmp_path, format_name, write, read):
+    file_path = tmp_path / f"report.{format_name}"
+    write(SUMMARY, iter(CITIES.items()), file_path, "Spain", "2021-09-25")
+
+    assert read(file_path).cities == CITIES
+
+
+def test_struct_rejects_other_files(tmp_path):
+    file_path = tmp_path / "report.bin"
+    file_path.write_bytes(b"not a weather file at all")
+
+    with pytest.raises(ValueError, match="not a weather columnar file"):
+        read_weather_struct(file_path)
+
+
+@pytest.mark.parametrize(
+    "city_name",
+    ["Santa Cruz de Tenerife" * 4, "Логроньо-Сан-Себастьян-де-лос-Рейес.Spain.2021-09-25", ""],
+)
+def test_struct_round_trips_long_city_names(tmp_path, city_name):
+    cities = {city_name: CITIES["Logroño"], "Logroño": CITIES["Logroño"]}
+    file_path = tmp_path / "report.bin"
+
+    write_weather_struct(SUMMARY, cities, file_path, "Spain", "2021-09-25")
+
+    assert read_weather_struct(file_path).cities == {name: pytest.approx(values) for name, values in cities.items()}
+
+
+@pytest.mark.parametrize("cities", [CITIES, {}])
+def test_write_weather_xml_matches_tree_builder(tmp_path, cities):
+    tree_path = tmp_path / "tree.xml"
+    stream_path = tmp_path / "stream.xml"
+    save_xml_file(create_weather_xml(SUMMARY, cities, "Spain", "2021-09-25"), tree_path)
+
+    write_weather_xml(SUMMARY, iter(cities.items()), stream_path, "Spain", "2021-09-25")
+
+    assert stream_path.read_bytes() == tree_path.read_bytes()
+
+
+def test_write_weather_xml_matches_example_result(tmp_path):
+    example = SERIALIZERS["xml"].read(EXAMPLE_RESULT)
+    example_root = etree.parse(str(EXAMPLE_RESULT)).getroot()
+    summary = dict(example_root.find("summary").attrib)
+    cities = {city.tag: dict(city.attrib) for city in example_root.find("cities")}
+    file_path = tmp_path / "result.xml"
+
+    write_weather_xml(summary, cities, file_path, example.country, example.date)
+
+    assert SERIALIZERS["xml"].read(file_path) == example
+    assert etree.tostring(etree.parse(str(file_path))) == etree.tostring(etree.parse(str(EXAMPLE_RESULT)))
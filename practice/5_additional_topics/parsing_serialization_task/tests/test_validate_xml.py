@@ -0,0 +1,70 @@
+import sys
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+sys.path.append(str(Path(__file__).resolve().parent))
+from main import (
+    create_weather_xml,
+    discover_partitions,
+    get_country_stats,
+    iter_partition_cities,
+    merge_partition_cities,
+    save_xml_file,
+)
+from validate_xml import check_result, check_result_iterparse
+
+SOURCE_DIR = Path(__file__).resolve().parents[1] / "source_data"
+
+
+@pytest.fixture(scope="module")
+def report_xml():
+    partitions = discover_partitions(SOURCE_DIR)
+    country, date, cities_data = merge_partition_cities(dict(iter_partition_cities(partitions)))
+    return create_weather_xml(get_country_stats(cities_data), cities_data, country, date)
+
+
+def save_report(report_xml, file_path, mutate=None):
+    root = etree.fromstring(etree.tostring(report_xml))
+    if mutate is not None:
+        mutate(root)
+    save_xml_file(root, file_path)
+    return str(file_path)
+
+
+def remove_summary(root):
+    root.remove(root.find("summary"))
+
+
+def remove_city(root):
+    cities = root.find("cities")
+    cities.remove(cities[0])
+
+
+def set_wrong_warmest_place(root):
+    root.find("summary").set("warmest_place", "Madrid")
+
+
+def add_root_attribute(root):
+    root.set("source", "test")
+
+
+def test_validators_accept_source_data_report(tmp_path, report_xml):
+    xml_path = save_report(report_xml, tmp_path / "result.xml")
+
+    check_result(xml_path)
+    check_result_iterparse(xml_path)
+
+
+@pytest.mark.parametrize("mutate", [remove_summary, remove_city, set_wrong_warmest_place, add_root_attribute])
+def test_validators_reject_mutated_report_alike(tmp_path, report_xml, mutate):
+    xml_path = save_report(report_xml, tmp_path / "result.xml", mutate)
+
+    with pytest.raises(AssertionError) as tree_error:
+        check_result(xml_path)
+    with pytest.raises(AssertionError) as iterparse_error:
+        check_result_iterparse(xml_path)
+
+    assert str(iterparse_error.value) == str(tree_error.value)
@@ -1,3 +1,4 @@
+from fractions import Fraction
 from statistics import mean
 from lxml import etree
 
@@ -68,5 +69,99 @@ def check_result(xml_path: str):
     print("Success!")
 
 
+def check_result_iterparse(xml_path: str):
+    """Same checks as check_result in a single etree.iterparse pass with element clearing,
+    so memory does not depend on the size of the XML file"""
+
+    summary_attribs = {'mean_temp', 'mean_wind_speed', 'coldest_place', 'warmest_place', 'windiest_place'}
+    city_attribs = {'mean_temp', 'mean_wind_speed',
+                    'min_temp', 'min_wind_speed',
+                    'max_temp', 'max_wind_speed'}
+
+    children_tags = set()
+    summary = None
+    cities_count = 0
+    # statistics.mean sums exactly, so do the same to get an identical rounded value
+    mean_temps_sum = Fraction(0)
+    warmest = coldest = windiest = None
+    depth = 0
+
+    for event, element in etree.iterparse(xml_path, events=('start', 'end')):
+        if event == 'start':
+            if depth == 0:
+                assert element.tag == 'weather'
+                assert not set(element.attrib.keys()).difference({'country', 'date'}), \
+                    "No 'country' or 'date' attrib in 'weather' root"
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth == 2:
+            assert set(element.attrib.keys()) == city_attribs, \
+                f"Invalid attributes in element {element.tag}: {set(element.attrib.keys()).difference(city_attribs)}"
+            cities_count += 1
+
+            if element.tag == 'Seville':
+                try:
+                    assert float(element.attrib.get('mean_temp')) == 21.6
+                    assert float(element.attrib.get('mean_wind_speed')) == 1.04
+                    assert float(element.attrib.get('min_temp')) == 17.24
+                    assert float(element.attrib.get('min_wind_speed')) == 0.45
+                    assert float(element.attrib.get('max_temp')) == 27.13
+                    assert float(element.attrib.get('max_wind_speed')) == 2.24
+                except AssertionError:
+                    raise AssertionError("Incorrect values for random city.")
+
+            mean_temp = float(element.attrib['mean_temp'])
+            mean_wind_speed = float(element.attrib['mean_wind_speed'])
+            mean_temps_sum += Fraction(mean_temp)
+            # strict comparisons keep the first city, like max() and min() do
+            if warmest is None or mean_temp > warmest[1]:
+                warmest = (element.tag, mean_temp)
+            if coldest is None or mean_temp < coldest[1]:
+                coldest = (element.tag, mean_temp)
+            if windiest is None or mean_wind_speed > windiest[1]:
+                windiest = (element.tag, mean_wind_speed)
+
+        elif depth == 1:
+            children_tags.add(element.tag)
+            if element.tag == 'summary':
+                assert set(element.attrib.keys()) == summary_attribs, \
+                    f'Invalid attributes list in "summary" element: {set(element.attrib.keys()).difference(summary_attribs)}'
+                summary = dict(element.attrib)
+            if element.tag == 'cities':
+                assert cities_count == 17, f"Invalid number of cities in XML: {cities_count}"
+
+        if depth >= 1:
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    assert children_tags == {'summary', 'cities'}, \
+        f'Invalid elements in "weather" root'
+
+    # check results in summary
+    mean_temp = round(float(mean_temps_sum / cities_count), 2)
+    assert float(summary['mean_temp']) == mean_temp, "Incorrect mean temperature in summary."
+
+    assert summary.get('warmest_place') == 'Palma', \
+        "The warmest place is incorrect"
+    assert warmest[0] == summary.get('warmest_place'), \
+        "The warmest place is incorrect. You need to find city with maximum mean temperature"
+
+    assert summary.get('coldest_place') == 'Valladolid', \
+        "The coldest place is incorrect"
+    assert coldest[0] == summary.get('coldest_place'), \
+        "The coldest place is incorrect. You need to find city with minimum mean temperature"
+
+    assert summary.get('windiest_place') == 'Pamplona', \
+        "The windiest place is incorrect"
+    assert windiest[0] == summary.get('windiest_place'), \
+        "The coldest place is incorrect. You need to find city with maximum wind speed"
+
+    print("Success!")
+
+
 if __name__ == '__main__':
     check_result(xml_path='./example_result.xml')
+    check_result_iterparse(xml_path='./example_result.xml')
@@ -2,7 +2,7 @@ import argparse
 from pathlib import Path
 
 from bs4 import BeautifulSoup
-from utils import create_table_file, scrape_html
+from utils import HtmlCache, add_cache_arguments, cache_from_args, create_table_file
 
 
 def get_total_cash(soup: BeautifulSoup):
@@ -61,38 +61,42 @@ def get_best_gainers(soup: BeautifulSoup, get_link=False):
     return output_list
 
 
+def get_company_stats(soup: BeautifulSoup):
+    """Gets the statistics fields of the sheet."""
+    return {"52-Week Change": get_year_change(soup), "Total Cash": get_total_cash(soup)}
+
+
 def run(
-    output_path, input_html=None, source_dir=None, base_link=None, table_title="10 stocks with best 52-Week Change"
+    output_path,
+    input_html=None,
+    source_dir=None,
+    base_link=None,
+    table_title="10 stocks with best 52-Week Change",
+    cache=None,
 ):
     """Runs the main scraping and file generation process."""
+    if cache is None:
+        cache = HtmlCache()
     if input_html:
-        with open(input_html, encoding="utf-8") as f:
-            main_soup = BeautifulSoup(f.read(), "html.parser")
+        main_page = cache.read(input_html)
     elif base_link is not None:
-        main_soup = scrape_html(base_link + "/markets/stocks/52-week-gainers/")
+        main_page = cache.get(base_link + "/markets/stocks/52-week-gainers/")
 
-    best_gainers = get_best_gainers(main_soup, get_link=(base_link is not None))
+    best_gainers = cache.extract(main_page, get_best_gainers, base_link is not None)
 
     companies_info = []
     for company in best_gainers:
-        company_soup = None
+        company_page = None
         if source_dir:
             stats_file = Path(source_dir) / f"{company['code']}_stats.html"
             if stats_file.exists():
-                with open(stats_file, encoding="utf-8") as f:
-                    company_soup = BeautifulSoup(f.read(), "html.parser")
+                company_page = cache.read(stats_file)
         elif base_link and company.get("link"):
-            url = base_link + company["link"] + "/key-statistics/"
-            company_soup = scrape_html(url)
+            company_page = cache.get(base_link + company["link"] + "/key-statistics/")
 
-        if company_soup:
+        if company_page:
             companies_info.append(
-                {
-                    "Name": company["name"],
-                    "Code": company["code"],
-                    "52-Week Change": get_year_change(company_soup),
-                    "Total Cash": get_total_cash(company_soup),
-                }
+                {"Name": company["name"], "Code": company["code"], **cache.extract(company_page, get_company_stats)}
             )
 
     create_table_file(companies_info, table_title, output_path)
@@ -106,20 +110,25 @@ def main():
     parser.add_argument(
         "-o", "--output", default=str(script_dir / "best_year_change.txt"), help="Path to save the result file."
     )
+    add_cache_arguments(parser, script_dir / ".html_cache")
     args = parser.parse_args()
+    cache = cache_from_args(args)
 
     # Run locally
     run(
         output_path=Path(args.output),
         input_html=Path(args.input) / "best_year_change.html",
         source_dir=Path(args.input),
+        cache=cache,
     )
 
     # Run with scraping
     # run(
     #     output_path=Path(args.output),
     #     base_link="https://finance.yahoo.com",
+    #     cache=cache,
     # )
+    cache.save()
 
 
 if __name__ == "__main__":
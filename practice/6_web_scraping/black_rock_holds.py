@@ -2,21 +2,14 @@ import argparse
 from pathlib import Path
 
 from bs4 import BeautifulSoup
-from utils import create_table_file, scrape_html
+from utils import HtmlCache, add_cache_arguments, cache_from_args, create_table_file
 
 
-def run(output_path, input_html=None, base_link=None, table_title="10 largest holds of Blackrock Inc."):
-    """Extracts top holders from an HTML file and saves them to a table."""
-    if input_html:
-        with open(input_html, encoding="utf-8") as f:
-            main_soup = BeautifulSoup(f.read(), "html.parser")
-    elif base_link is not None:
-        main_soup = scrape_html(base_link + "/quote/BLK/holders/")
-
+def get_top_holders(soup: BeautifulSoup):
+    """Gets the 10 largest institutional holders from the holders page."""
     holders_info = []
-
     try:
-        top_holders_section = main_soup.find("section", attrs={"data-testid": "holders-top-institutional-holders"})
+        top_holders_section = soup.find("section", attrs={"data-testid": "holders-top-institutional-holders"})
         top_holders_table_body = top_holders_section.find("tbody")
 
         for company_row in top_holders_table_body.find_all("tr")[:10]:
@@ -32,8 +25,19 @@ def run(output_path, input_html=None, base_link=None, table_title="10 largest ho
             )
     except (AttributeError, IndexError):
         pass
+    return holders_info
+
+
+def run(output_path, input_html=None, base_link=None, table_title="10 largest holds of Blackrock Inc.", cache=None):
+    """Extracts top holders from an HTML file and saves them to a table."""
+    if cache is None:
+        cache = HtmlCache()
+    if input_html:
+        main_page = cache.read(input_html)
+    elif base_link is not None:
+        main_page = cache.get(base_link + "/quote/BLK/holders/")
 
-    create_table_file(holders_info, table_title, output_path)
+    create_table_file(cache.extract(main_page, get_top_holders), table_title, output_path)
 
 
 def main():
@@ -44,15 +48,18 @@ def main():
     parser.add_argument(
         "-o", "--output", default=str(script_dir / "blackrock_holders.txt"), help="Path to save the result file."
     )
+    add_cache_arguments(parser, script_dir / ".html_cache")
     args = parser.parse_args()
+    cache = cache_from_args(args)
 
     output_path = Path(args.output)
     input_html = Path(args.input) / "blk_holders.html"
     # Run locally
-    run(output_path, input_html)
+    run(output_path, input_html, cache=cache)
 
     # Run with scraping
-    # run(output_path, base_link="https://finance.yahoo.com")
+    # run(output_path, base_link="https://finance.yahoo.com", cache=cache)
+    cache.save()
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 from pathlib import Path
 
 import pytest
-from utils import create_table_file
+import utils
+from utils import HtmlCache, create_table_file, extractor_version
 
 
 @pytest.fixture
@@ -80,3 +81,174 @@ def test_column_width_calculation(tmp_path, sample_data):
     assert "| Code " in header_row
     assert "| Value " in header_row
     assert data_row_1.startswith("| Test Inc. ")
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class FakeSession:
+    """Serves pages from a dict and answers 304 when the If-None-Match header matches the ETag."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+
+    def get(self, url, headers=None):
+        headers = headers or {}
+        self.requests.append((url, headers))
+        content = self.pages[url]
+        etag = f'"{len(content)}"'
+        if headers.get("If-None-Match") == etag:
+            return FakeResponse(304)
+        return FakeResponse(200, content, {"ETag": etag, "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+
+def get_titles(soup):
+    return [title.text for title in soup.find_all("h1")]
+
+
+def test_html_cache_serves_fresh_pages_without_requests(tmp_path):
+    session = FakeSession({"https://example.com/a": b"<h1>A</h1>"})
+    cache = HtmlCache(tmp_path, session=session)
+
+    first_page = cache.get("https://example.com/a")
+    second_page = cache.get("https://example.com/a")
+
+    assert first_page == second_page
+    assert len(session.requests) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_html_cache_revalidates_expired_pages(tmp_path):
+    session = FakeSession({"https://example.com/a": b"<h1>A</h1>"})
+    cache = HtmlCache(tmp_path, ttl=0, session=session)
+
+    cache.get("https://example.com/a")
+    page = cache.get("https://example.com/a")
+
+    assert page.content == b"<h1>A</h1>"
+    assert session.requests[1][1] == {
+        "If-None-Match": '"10"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+    assert cache.revalidated == 1
+
+
+def test_html_cache_stores_same_content_once(tmp_path):
+    session = FakeSession({"https://example.com/a": b"<h1>A</h1>", "https://example.com/b": b"<h1>A</h1>"})
+    cache = HtmlCache(tmp_path, session=session)
+
+    first_page = cache.get("https://example.com/a")
+    second_page = cache.get("https://example.com/b")
+
+    assert first_page.content_hash == second_page.content_hash
+    assert len(list(tmp_path.glob("*.html"))) == 1
+    assert cache.soup(first_page) is cache.soup(second_page)
+
+
+def test_html_cache_evicts_least_recently_used(tmp_path):
+    pages = {f"https://example.com/{name}": f"<h1>{name * 20}</h1>".encode() for name in "abc"}
+    session = FakeSession(pages)
+    cache = HtmlCache(tmp_path, max_bytes=70, session=session)
+
+    cache.get("https://example.com/a")
+    cache.get("https://example.com/b")
+    cache.get("https://example.com/a")
+    cache.get("https://example.com/c")
+    cache.get("https://example.com/a")
+    cache.get("https://example.com/b")
+
+    # b was the least recently used page when c was added, so only b is downloaded again
+    assert [url for url, _ in session.requests] == [
+        "https://example.com/a",
+        "https://example.com/b",
+        "https://example.com/c",
+        "https://example.com/b",
+    ]
+    assert len(list(tmp_path.glob("*.html"))) == 2
+
+
+def test_html_cache_persists_extracted_results(tmp_path):
+    html_file = tmp_path / "page.html"
+    html_file.write_text("<h1>First</h1><h1>Second</h1>", encoding="utf-8")
+    cache = HtmlCache(tmp_path / "cache")
+    assert cache.extract(cache.read(html_file), get_titles) == ["First", "Second"]
+    cache.save()
+
+    reloaded_cache = HtmlCache(tmp_path / "cache")
+    page = reloaded_cache.read(html_file)
+    assert reloaded_cache.extract(page, get_titles) == ["First", "Second"]
+    # The result came from the index, the page was not parsed again
+    assert page.content_hash not in reloaded_cache._soups
+
+
+def get_title_count(soup, tag):
+    return len(soup.find_all(tag))
+
+
+def test_html_cache_drops_results_of_changed_extractor(tmp_path, monkeypatch):
+    html_file = tmp_path / "page.html"
+    html_file.write_text("<h1>First</h1><h2>Second</h2>", encoding="utf-8")
+    cache = HtmlCache(tmp_path / "cache")
+    page = cache.read(html_file)
+    assert cache.extract(page, get_title_count, "h1") == 1
+    assert cache.extract(page, get_title_count, "h2") == 1
+    cache.save()
+
+    monkeypatch.setattr(utils, "extractor_version", lambda extractor: "changed")
+    reloaded_cache = HtmlCache(tmp_path / "cache")
+    page = reloaded_cache.read(html_file)
+    assert reloaded_cache.extract(page, get_title_count, "h1") == 1
+    # The old results were dropped and the page had to be parsed for the new version
+    assert page.content_hash in reloaded_cache._soups
+    assert list(reloaded_cache._contents[page.content_hash]["results"]) == [
+        f"{__name__}.get_title_count@changed('h1',)"
+    ]
+
+
+def test_extractor_version_follows_source_file(tmp_path, monkeypatch):
+    module_path = tmp_path / "extractors_module.py"
+    module_path.write_text("def extract(soup):\n    return 1\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    import extractors_module
+
+    first_version = extractor_version(extractors_module.extract)
+    utils._source_hash.cache_clear()
+    module_path.write_text("def extract(soup):\n    return 2\n", encoding="utf-8")
+
+    assert extractor_version(extractors_module.extract) != first_version
+    assert extractor_version(get_titles) == extractor_version(get_title_count)
+
+
+def test_html_cache_ignores_truncated_index(tmp_path):
+    session = FakeSession({"https://example.com/a": b"<h1>A</h1>"})
+    cache = HtmlCache(tmp_path, session=session)
+    page = cache.get("https://example.com/a")
+    cache.save()
+    index_path = tmp_path / "index.json"
+    index_path.write_text(index_path.read_text(encoding="utf-8")[:20], encoding="utf-8")
+
+    with pytest.warns(UserWarning, match="unreadable HTML cache index"):
+        reloaded_cache = HtmlCache(tmp_path, session=session)
+
+    assert reloaded_cache.get("https://example.com/a") == page
+    assert len(session.requests) == 2
+    reloaded_cache.save()
+    assert list(tmp_path.glob("*.tmp")) == []
+    assert HtmlCache(tmp_path, session=session).get("https://example.com/a") == page
+
+
+def test_html_cache_invalidate_removes_stored_pages(tmp_path):
+    session = FakeSession({"https://example.com/a": b"<h1>A</h1>"})
+    cache = HtmlCache(tmp_path, session=session)
+    page = cache.get("https://example.com/a")
+    cache.save()
+    assert (tmp_path / f"{page.content_hash}.html").exists()
+
+    HtmlCache(tmp_path, session=session, invalidate=True)
+
+    assert list(tmp_path.glob("*.html")) == []
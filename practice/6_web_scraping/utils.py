@@ -1,6 +1,22 @@
+import hashlib
+import inspect
+import json
+import os
+import time
+import warnings
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
 import requests
 from bs4 import BeautifulSoup
 
+CACHE_VERSION = 1
+DEFAULT_TTL = 60 * 60
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_SOUPS = 32
+
 
 def create_table_file(data, title, filename):
     if not data:
@@ -26,7 +42,246 @@ def create_table_file(data, title, filename):
         f.write("\n".join(output))
 
 
-def scrape_html(url):
+def scrape_html(url, cache=None):
     print("Scraping ...")
+    if cache is not None:
+        return cache.soup(cache.get(url))
     page = requests.get(url)
     return BeautifulSoup(page.content, "html.parser")
+
+
+@lru_cache(maxsize=None)
+def _source_hash(source_file: Optional[str]) -> str:
+    if source_file is None:
+        return ""
+    try:
+        return hashlib.sha256(Path(source_file).read_bytes()).hexdigest()[:16]
+    except OSError:
+        return ""
+
+
+def extractor_version(extractor: Callable) -> str:
+    """Returns a hash of the source file that defines extractor.
+
+    The whole module is hashed, so editing the extractor or any helper defined next to it
+    gives a new version. Without a source file the bytecode of the extractor is hashed.
+    """
+    try:
+        source_hash = _source_hash(inspect.getsourcefile(extractor))
+    except TypeError:
+        source_hash = ""
+    if source_hash:
+        return source_hash
+    code = getattr(extractor, "__code__", None)
+    return hashlib.sha256(code.co_code).hexdigest()[:16] if code is not None else ""
+
+
+class Page(NamedTuple):
+    """Raw HTML with the sha256 hex digest it is cached under."""
+
+    content_hash: str
+    content: bytes
+
+
+class HtmlCache:
+    """Content-addressed cache of HTML pages, their soups and the results extracted from them.
+
+    Downloaded bodies are stored once per sha256 in cache_dir, and index.json maps every URL
+    to its hash with the ETag and Last-Modified headers. URLs fetched less than ttl seconds
+    ago are served without a request, older ones are revalidated with a conditional GET.
+    When the stored bodies and results exceed max_bytes, the least recently used contents
+    are evicted. Soups are kept in memory for the max_soups most recently used hashes.
+    Without cache_dir nothing is written to disk.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_soups: int = DEFAULT_MAX_SOUPS,
+        invalidate: bool = False,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_soups = max_soups
+        self.session = session or requests.Session()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._urls = {}
+        self._contents = {}
+        self._blobs = {}
+        self._soups = OrderedDict()
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            index_path = self.cache_dir / "index.json"
+            if not invalidate and index_path.exists():
+                try:
+                    index = json.loads(index_path.read_text(encoding="utf-8"))
+                    if index.get("version") == CACHE_VERSION:
+                        self._urls = dict(index["urls"])
+                        self._contents = dict(index["contents"])
+                except (ValueError, KeyError, TypeError, AttributeError) as err:
+                    warnings.warn(f"Ignoring unreadable HTML cache index {index_path}: {err}")
+            self._remove_untracked_blobs()
+
+    def _remove_untracked_blobs(self) -> None:
+        """Deletes stored bodies the index does not know about, so they never escape max_bytes."""
+        for blob_path in self.cache_dir.glob("*.html"):
+            record = self._contents.get(blob_path.stem)
+            if len(blob_path.stem) == 64 and (record is None or not record.get("stored")):
+                blob_path.unlink(missing_ok=True)
+
+    def _touch(self, content_hash: str) -> Dict[str, Any]:
+        record = self._contents.setdefault(content_hash, {"size": 0, "stored": False, "results": {}})
+        record["accessed_at"] = time.time()
+        return record
+
+    def _load_blob(self, content_hash: str) -> Optional[bytes]:
+        if content_hash in self._blobs:
+            return self._blobs[content_hash]
+        if self.cache_dir is None or not self._contents.get(content_hash, {}).get("stored"):
+            return None
+        try:
+            return (self.cache_dir / f"{content_hash}.html").read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _store_blob(self, content: bytes) -> str:
+        content_hash = hashlib.sha256(content).hexdigest()
+        record = self._touch(content_hash)
+        if not record["stored"]:
+            if self.cache_dir is not None:
+                (self.cache_dir / f"{content_hash}.html").write_bytes(content)
+            else:
+                self._blobs[content_hash] = content
+            record["stored"] = True
+            record["size"] += len(content)
+            self._evict()
+        return content_hash
+
+    def _evict(self) -> None:
+        total_size = sum(record["size"] for record in self._contents.values())
+        if total_size <= self.max_bytes:
+            return
+        evicted_hashes = set()
+        for content_hash, record in sorted(self._contents.items(), key=lambda item: item[1]["accessed_at"]):
+            if total_size <= self.max_bytes:
+                break
+            total_size -= record["size"]
+            evicted_hashes.add(content_hash)
+            del self._contents[content_hash]
+            self._blobs.pop(content_hash, None)
+            self._soups.pop(content_hash, None)
+            if self.cache_dir is not None and record["stored"]:
+                (self.cache_dir / f"{content_hash}.html").unlink(missing_ok=True)
+        self._urls = {url: entry for url, entry in self._urls.items() if entry["hash"] not in evicted_hashes}
+
+    def get(self, url: str) -> Page:
+        """Returns the page of url, downloading or revalidating it only when needed."""
+        entry = self._urls.get(url)
+        content = self._load_blob(entry["hash"]) if entry is not None else None
+        if content is not None and time.time() - entry["fetched_at"] < self.ttl:
+            self.hits += 1
+            self._touch(entry["hash"])
+            return Page(entry["hash"], content)
+
+        headers = {}
+        if content is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        response = self.session.get(url, headers=headers)
+        if content is not None and response.status_code == 304:
+            self.revalidated += 1
+            entry["fetched_at"] = time.time()
+            self._touch(entry["hash"])
+            return Page(entry["hash"], content)
+
+        self.misses += 1
+        content = response.content
+        if response.status_code != 200:
+            return Page(hashlib.sha256(content).hexdigest(), content)
+        content_hash = self._store_blob(content)
+        self._urls[url] = {
+            "hash": content_hash,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+        }
+        return Page(content_hash, content)
+
+    def read(self, file_path: Path) -> Page:
+        """Returns the page of a local HTML file. Its body is not copied to the cache."""
+        content = Path(file_path).read_bytes()
+        content_hash = hashlib.sha256(content).hexdigest()
+        self._touch(content_hash)
+        return Page(content_hash, content)
+
+    def soup(self, page: Page) -> BeautifulSoup:
+        """Returns the parsed page, parsing every content hash once while it is in memory."""
+        soup = self._soups.get(page.content_hash)
+        if soup is not None:
+            self._soups.move_to_end(page.content_hash)
+            return soup
+        soup = BeautifulSoup(page.content, "html.parser")
+        self._soups[page.content_hash] = soup
+        if len(self._soups) > self.max_soups:
+            self._soups.popitem(last=False)
+        return soup
+
+    def extract(self, page: Page, extractor: Callable[..., Any], *args: Any) -> Any:
+        """Returns extractor(soup, *args) for the page, memoized per content hash.
+
+        Results are stored as JSON and keyed by the extractor name, its extractor_version
+        and args, so pages seen in earlier runs are neither parsed nor extracted again, and
+        changing the module of the extractor makes its old results unreachable.
+        """
+        record = self._touch(page.content_hash)
+        extractor_prefix = f"{extractor.__module__}.{extractor.__qualname__}@"
+        version_prefix = extractor_prefix + extractor_version(extractor)
+        result_key = f"{version_prefix}{args!r}"
+        # Results of older versions of this extractor can never be hit again
+        for stale_key in [
+            key for key in record["results"] if key.startswith(extractor_prefix) and not key.startswith(version_prefix)
+        ]:
+            record["size"] -= len(json.dumps(record["results"].pop(stale_key)))
+        if result_key in record["results"]:
+            return record["results"][result_key]
+        serialized_result = json.dumps(extractor(self.soup(page), *args))
+        # Round trip, so a fresh result has the same types as a cached one
+        record["results"][result_key] = result = json.loads(serialized_result)
+        record["size"] += len(serialized_result)
+        self._evict()
+        return result
+
+    def save(self) -> None:
+        """Writes the index of URLs and contents back to disk.
+
+        The index is written to a temporary file first and then renamed over the old one,
+        so an interrupted run never leaves a truncated index behind.
+        """
+        if self.cache_dir is not None:
+            index = {"version": CACHE_VERSION, "urls": self._urls, "contents": self._contents}
+            index_path = self.cache_dir / "index.json"
+            temp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+            temp_path.write_text(json.dumps(index), encoding="utf-8")
+            os.replace(temp_path, index_path)
+
+
+def add_cache_arguments(parser, default_cache_dir):
+    parser.add_argument("--cache", default=str(default_cache_dir), help="Directory of the HTML cache.")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the HTML cache.")
+    parser.add_argument(
+        "--invalidate-cache", action="store_true", help="Ignore the existing cache and fetch and parse every page."
+    )
+
+
+def cache_from_args(args):
+    if args.no_cache:
+        return HtmlCache()
+    return HtmlCache(Path(args.cache), invalidate=args.invalidate_cache)
@@ -3,7 +3,7 @@ import re
 from pathlib import Path
 
 from bs4 import BeautifulSoup
-from utils import create_table_file, scrape_html
+from utils import HtmlCache, add_cache_arguments, cache_from_args, create_table_file
 
 
 def get_ceo_name_and_year(soup: BeautifulSoup):
@@ -73,39 +73,48 @@ def get_most_active_companies(soup: BeautifulSoup, get_link=False):
     return output_list
 
 
-def run(output_path, input_html=None, source_dir=None, base_link=None, table_title="5 stocks with youngest CEOs"):
+def get_company_profile(soup: BeautifulSoup):
+    """Gets the profile fields of the sheet."""
+    ceo_name, ceo_year_born = get_ceo_name_and_year(soup)
+    return {
+        "Country": get_company_country(soup),
+        "Employees": get_company_employees(soup),
+        "CEO Name": ceo_name,
+        "CEO Year Born": ceo_year_born,
+    }
+
+
+def run(
+    output_path,
+    input_html=None,
+    source_dir=None,
+    base_link=None,
+    table_title="5 stocks with youngest CEOs",
+    cache=None,
+):
     """Runs the main scraping and file generation process."""
+    if cache is None:
+        cache = HtmlCache()
     if input_html:
-        with open(input_html, encoding="utf-8") as f:
-            main_soup = BeautifulSoup(f.read(), "html.parser")
+        main_page = cache.read(input_html)
     elif base_link is not None:
-        main_soup = scrape_html(base_link + "/markets/stocks/most-active/")
+        main_page = cache.get(base_link + "/markets/stocks/most-active/")
 
-    most_active = get_most_active_companies(main_soup, get_link=(base_link is not None))
+    most_active = cache.extract(main_page, get_most_active_companies, base_link is not None)
 
     companies_info = []
     for company in most_active:
-        company_soup = None
+        company_page = None
         if source_dir:
             profile_file = Path(source_dir) / f"{company['code']}_profile.html"
             if profile_file.exists():
-                with open(profile_file, encoding="utf-8") as f:
-                    company_soup = BeautifulSoup(f.read(), "html.parser")
+                company_page = cache.read(profile_file)
         elif base_link and company.get("link"):
-            url = base_link + company["link"] + "/profile"
-            company_soup = scrape_html(url)
+            company_page = cache.get(base_link + company["link"] + "/profile")
 
-        if company_soup:
-            ceo_name, ceo_year_born = get_ceo_name_and_year(company_soup)
+        if company_page:
             companies_info.append(
-                {
-                    "Name": company["name"],
-                    "Code": company["code"],
-                    "Country": get_company_country(company_soup),
-                    "Employees": get_company_employees(company_soup),
-                    "CEO Name": ceo_name,
-                    "CEO Year Born": ceo_year_born,
-                }
+                {"Name": company["name"], "Code": company["code"], **cache.extract(company_page, get_company_profile)}
             )
 
     sorted_data = sorted(companies_info, key=lambda c: c["CEO Year Born"], reverse=True)
@@ -120,20 +129,25 @@ def main():
     parser.add_argument(
         "-o", "--output", default=str(script_dir / "most_youngest_ceo.txt"), help="Path to save the result file."
     )
+    add_cache_arguments(parser, script_dir / ".html_cache")
     args = parser.parse_args()
+    cache = cache_from_args(args)
 
     # Run locally
     run(
         output_path=Path(args.output),
         input_html=Path(args.input) / "main_page.html",
         source_dir=Path(args.input),
+        cache=cache,
     )
 
     # Run with scraping
     # run(
     #     output_path=Path(args.output),
     #     base_link="https://finance.yahoo.com",
+    #     cache=cache,
     # )
+    cache.save()
 
 
 if __name__ == "__main__":